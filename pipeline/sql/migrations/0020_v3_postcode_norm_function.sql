@@ -0,0 +1,14 @@
+BEGIN;
+
+-- SQL twin of pipeline.util.normalise.postcode_norm so set-based stage loaders
+-- share one definition. IMMUTABLE lets the planner inline it.
+CREATE OR REPLACE FUNCTION core.postcode_norm(value text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT NULLIF(upper(regexp_replace(COALESCE(value, ''), '[^A-Za-z0-9]', '', 'g')), '')
+$$;
+
+COMMIT;
@@ -0,0 +1,9 @@
+BEGIN;
+
+-- Pass 7 matches PPD street tokens to canonical streets by casefolded name.
+-- INCLUDE lets the join read usrn/street_name without heap lookups.
+CREATE INDEX IF NOT EXISTS idx_core_streets_usrn_run_casefolded
+    ON core.streets_usrn (produced_build_run_id, street_name_casefolded)
+    INCLUDE (usrn, street_name);
+
+COMMIT;
@@ -0,0 +1,12 @@
+BEGIN;
+
+-- Stage tables key postcodes by compact postcode_norm; storing the same form on
+-- core.postcodes lets Pass 3/5/6/7 join on plain column equality.
+ALTER TABLE core.postcodes
+    ADD COLUMN IF NOT EXISTS postcode_norm text
+    GENERATED ALWAYS AS (replace(postcode, ' ', '')) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_core_postcodes_run_postcode_norm
+    ON core.postcodes (produced_build_run_id, postcode_norm);
+
+COMMIT;
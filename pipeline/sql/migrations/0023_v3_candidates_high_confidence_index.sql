@@ -0,0 +1,10 @@
+BEGIN;
+
+-- Pass 5 only falls back for postcodes without a high-confidence candidate; the
+-- partial index keeps that anti-join probe to high rows only. The unfiltered
+-- (produced_build_run_id, postcode) index from 0005 serves Pass 6.
+CREATE INDEX IF NOT EXISTS idx_candidate_run_postcode_high
+    ON derived.postcode_street_candidates (produced_build_run_id, postcode)
+    WHERE confidence = 'high';
+
+COMMIT;
@@ -0,0 +1,10 @@
+BEGIN;
+
+-- Pass 3 promotes Open Names candidates by joining evidence_json ->> 'toid' to
+-- LIDS; an expression index over the same predicate makes that key indexable.
+CREATE INDEX IF NOT EXISTS idx_candidate_run_evidence_toid
+    ON derived.postcode_street_candidates (produced_build_run_id, (evidence_json ->> 'toid'))
+    WHERE candidate_type = 'names_postcode_feature'
+      AND evidence_json ->> 'toid' IS NOT NULL;
+
+COMMIT;
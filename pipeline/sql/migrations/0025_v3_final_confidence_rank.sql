@@ -0,0 +1,27 @@
+BEGIN;
+
+-- The API lookup projection orders each postcode's streets by probability and
+-- confidence rank; storing the rank and indexing that order lets jsonb_agg read
+-- presorted rows instead of sorting on a CASE expression per postcode.
+ALTER TABLE derived.postcode_streets_final
+    ADD COLUMN IF NOT EXISTS confidence_rank smallint
+    GENERATED ALWAYS AS (
+        CASE confidence
+            WHEN 'high' THEN 3
+            WHEN 'medium' THEN 2
+            WHEN 'low' THEN 1
+            ELSE 0
+        END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_final_run_postcode_projection
+    ON derived.postcode_streets_final (
+        produced_build_run_id,
+        postcode,
+        probability DESC,
+        confidence_rank DESC,
+        street_name COLLATE "C",
+        usrn
+    );
+
+COMMIT;
@@ -0,0 +1,13 @@
+BEGIN;
+
+-- verify_build hashes final rows in (postcode, street_name) "C" order; an index in
+-- that order lets the hash scan read presorted rows instead of sorting the build.
+CREATE INDEX IF NOT EXISTS idx_final_run_postcode_street_c
+    ON derived.postcode_streets_final (
+        produced_build_run_id,
+        postcode COLLATE "C",
+        street_name COLLATE "C",
+        usrn
+    );
+
+COMMIT;
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import os
 import re
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import psycopg
 from psycopg import sql
+from psycopg.rows import tuple_row
 from psycopg.types.json import Jsonb
 
 from pipeline.config import (
@@ -65,6 +69,15 @@ class PublishResult:
     status: str
 
 
+@dataclass(frozen=True)
+class StageCopyTarget:
+    """Stage table loaded by COPY into a temp mirror and merged with one upsert."""
+
+    table_name: str
+    columns: tuple[str, ...]
+    conflict_sql: str
+
+
 PASS_ORDER = (
     "0a_raw_ingest",
     "0b_stage_normalisation",
@@ -104,6 +117,8 @@ CANDIDATE_TYPES = (
 
 ROAD_NUMBER_PATTERN = r"^[ABM][[:space:]]*[0-9]{1,4}([[:space:]]*\([[:space:]]*M[[:space:]]*\))?$"
 PASS5_SPATIAL_RADIUS_M = 150.0
+VERSION_SUFFIX_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_]")
+NON_ALPHANUMERIC_RE = re.compile(r"[^A-Za-z0-9]")
 
 
 def _load_json_config(path: Path) -> dict[str, Any]:
@@ -116,14 +131,17 @@ def _load_json_config(path: Path) -> dict[str, Any]:
     return payload
 
 
+@lru_cache(maxsize=1)
 def _schema_config() -> dict[str, Any]:
     return _load_json_config(source_schema_config_path())
 
 
+@lru_cache(maxsize=1)
 def _open_names_family_config() -> dict[str, Any]:
     return _load_json_config(open_names_type_families_config_path())
 
 
+@lru_cache(maxsize=1)
 def _weight_config() -> dict[str, Decimal]:
     payload = _load_json_config(frequency_weights_config_path())
     raw_weights = payload.get("weights")
@@ -162,18 +180,11 @@ def _weight_config() -> dict[str, Decimal]:
 
 
 def _bundle_hash(build_profile: str, source_runs: dict[str, tuple[str, ...]]) -> str:
-    normalized_source_runs = {
-        source_name: sorted(run_ids)
-        for source_name, run_ids in source_runs.items()
-    }
-    payload = {
-        "build_profile": build_profile,
-        "source_runs": {
-            key: normalized_source_runs[key] for key in sorted(normalized_source_runs.keys())
-        },
-    }
-    encoded = json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    return hashlib.sha256(encoded).hexdigest()
+    # BuildBundleManifest canonicalises run-id order at construction; sort_keys
+    # reproduces the historical key ordering, so hashes of existing bundles are unchanged.
+    payload = {"build_profile": build_profile, "source_runs": source_runs}
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded, usedforsecurity=False).hexdigest()
 
 
 def _dataset_version_from_bundle_hash(bundle_hash: str) -> str:
@@ -181,7 +192,7 @@ def _dataset_version_from_bundle_hash(bundle_hash: str) -> str:
 
 
 def _safe_version_suffix(dataset_version: str) -> str:
-    suffix = re.sub(r"[^A-Za-z0-9_]", "_", dataset_version)
+    suffix = VERSION_SUFFIX_UNSAFE_RE.sub("_", dataset_version)
     return suffix or "v3"
 
 
@@ -219,36 +230,43 @@ def create_build_bundle(conn: psycopg.Connection, manifest: BuildBundleManifest)
             f"{manifest.build_profile}: {', '.join(unexpected)}"
         )
 
-    with conn.cursor() as cur:
-        for source_name in sorted(required_sources):
-            run_ids = manifest.source_runs[source_name]
-            if source_name == "ppd":
-                if len(run_ids) == 0:
-                    raise BuildError("Bundle must include at least one ppd ingest run")
-            else:
-                if len(run_ids) != 1:
-                    raise BuildError(
-                        f"Source {source_name} must map to exactly one ingest run in a bundle"
-                    )
+    for source_name in sorted(required_sources):
+        run_ids = manifest.source_runs[source_name]
+        if source_name == "ppd":
+            if len(run_ids) == 0:
+                raise BuildError("Bundle must include at least one ppd ingest run")
+        else:
+            if len(run_ids) != 1:
+                raise BuildError(
+                    f"Source {source_name} must map to exactly one ingest run in a bundle"
+                )
 
-            for run_id in run_ids:
-                cur.execute(
-                    """
-                    SELECT source_name
-                    FROM meta.ingest_run
-                    WHERE run_id = %s
-                    """,
-                    (run_id,),
+    all_run_ids = sorted(
+        {run_id for source_name in required_sources for run_id in manifest.source_runs[source_name]}
+    )
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT run_id::text, source_name
+            FROM meta.ingest_run
+            WHERE run_id = ANY(%s::uuid[])
+            """,
+            (all_run_ids,),
+        )
+        run_sources = {str(row[0]): row[1] for row in cur.fetchall()}
+
+    for source_name in sorted(required_sources):
+        for run_id in manifest.source_runs[source_name]:
+            row_source = run_sources.get(str(uuid.UUID(run_id)))
+            if row_source is None:
+                raise BuildError(f"Unknown ingest_run_id for source {source_name}: {run_id}")
+            if row_source != source_name:
+                raise BuildError(
+                    f"Ingest run/source mismatch: source={source_name} run_id={run_id} row_source={row_source}"
                 )
-                row = cur.fetchone()
-                if row is None:
-                    raise BuildError(f"Unknown ingest_run_id for source {source_name}: {run_id}")
-                if row[0] != source_name:
-                    raise BuildError(
-                        f"Ingest run/source mismatch: source={source_name} run_id={run_id} row_source={row[0]}"
-                    )
 
-    bundle_id = str(uuid.uuid4())
+    # Bind native UUIDs so psycopg sends typed uuid parameters rather than untyped text.
+    bundle_uuid = uuid.uuid4()
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -260,23 +278,25 @@ def create_build_bundle(conn: psycopg.Connection, manifest: BuildBundleManifest)
                 created_at_utc
             ) VALUES (%s, %s, %s, 'created', now())
             """,
-            (bundle_id, manifest.build_profile, bundle_hash),
+            (bundle_uuid, manifest.build_profile, bundle_hash),
         )
 
-        for source_name, run_ids in manifest.source_runs.items():
-            for ingest_run_id in run_ids:
-                cur.execute(
-                    """
-                    INSERT INTO meta.build_bundle_source (
-                        bundle_id,
-                        source_name,
-                        ingest_run_id
-                    ) VALUES (%s, %s, %s)
-                    """,
-                    (bundle_id, source_name, ingest_run_id),
-                )
+        cur.executemany(
+            """
+            INSERT INTO meta.build_bundle_source (
+                bundle_id,
+                source_name,
+                ingest_run_id
+            ) VALUES (%s, %s, %s)
+            """,
+            [
+                (bundle_uuid, source_name, ingest_run_id)
+                for source_name, run_ids in manifest.source_runs.items()
+                for ingest_run_id in run_ids
+            ],
+        )
 
-    return BuildBundleResult(bundle_id=bundle_id, status="created", bundle_hash=bundle_hash)
+    return BuildBundleResult(bundle_id=str(bundle_uuid), status="created", bundle_hash=bundle_hash)
 
 
 def _load_bundle(
@@ -352,7 +372,7 @@ def _latest_resumable_run(conn: psycopg.Connection, bundle_id: str) -> tuple[str
 
 
 def _load_completed_passes(conn: psycopg.Connection, build_run_id: str) -> set[str]:
-    with conn.cursor() as cur:
+    with conn.cursor(row_factory=tuple_row) as cur:
         cur.execute(
             """
             SELECT pass_name
@@ -402,10 +422,21 @@ def _env_flag_enabled(name: str, default: bool) -> bool:
     return default
 
 
+def _env_positive_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value.strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
 def _ordered_run_ids(conn: psycopg.Connection, run_ids: tuple[str, ...]) -> tuple[str, ...]:
     if not run_ids:
         return ()
-    with conn.cursor() as cur:
+    with conn.cursor(row_factory=tuple_row) as cur:
         cur.execute(
             """
             SELECT run_id::text
@@ -422,7 +453,7 @@ def _ordered_run_ids(conn: psycopg.Connection, run_ids: tuple[str, ...]) -> tupl
 
 
 def _create_build_run(conn: psycopg.Connection, bundle_id: str, dataset_version: str) -> str:
-    build_run_id = str(uuid.uuid4())
+    build_run_uuid = uuid.uuid4()
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -435,9 +466,9 @@ def _create_build_run(conn: psycopg.Connection, bundle_id: str, dataset_version:
                 started_at_utc
             ) VALUES (%s, %s, %s, 'started', 'initialising', now())
             """,
-            (build_run_id, bundle_id, dataset_version),
+            (build_run_uuid, bundle_id, dataset_version),
         )
-    return build_run_id
+    return str(build_run_uuid)
 
 
 def _set_build_run_pass(conn: psycopg.Connection, build_run_id: str, pass_name: str) -> None:
@@ -493,29 +524,44 @@ def _mark_build_failed(conn: psycopg.Connection, build_run_id: str, current_pass
 
 def _mark_build_built(conn: psycopg.Connection, bundle_id: str, build_run_id: str) -> None:
     with conn.cursor() as cur:
+        # Data-modifying CTEs always execute, so both status updates land in one round-trip.
         cur.execute(
             """
-            UPDATE meta.build_run
-            SET status = 'built',
-                current_pass = 'complete',
-                finished_at_utc = now(),
-                error_text = NULL
-            WHERE build_run_id = %s
-            """,
-            (build_run_id,),
-        )
-        cur.execute(
-            """
+            WITH run_update AS (
+                UPDATE meta.build_run
+                SET status = 'built',
+                    current_pass = 'complete',
+                    finished_at_utc = now(),
+                    error_text = NULL
+                WHERE build_run_id = %s
+                RETURNING build_run_id
+            )
             UPDATE meta.build_bundle
             SET status = 'built'
             WHERE bundle_id = %s
             """,
-            (bundle_id,),
+            (build_run_id, bundle_id),
         )
 
 
-RAW_FETCH_BATCH_SIZE = 5000
-STAGE_INSERT_BATCH_SIZE = 5000
+# Fetch and insert batches are tuned independently: server-side cursor fetches
+# favour larger pages, stage flushes trade client memory against round-trips.
+RAW_FETCH_BATCH_SIZE = _env_positive_int("PIPELINE_RAW_FETCH_BATCH_SIZE", 50000)
+STAGE_INSERT_BATCH_SIZE = _env_positive_int("PIPELINE_STAGE_INSERT_BATCH_SIZE", 10000)
+# Narrow stage rows (a handful of short columns) can buffer more rows per flush
+# for the same client memory; wide rows keep the default.
+NARROW_STAGE_INSERT_BATCH_SIZE = _env_positive_int("PIPELINE_NARROW_STAGE_INSERT_BATCH_SIZE", 50000)
+STAGE_INSERT_BATCH_SIZE_BY_TABLE = {
+    "stage.streets_usrn_input": NARROW_STAGE_INSERT_BATCH_SIZE,
+    "stage.open_roads_segment": NARROW_STAGE_INSERT_BATCH_SIZE,
+    "stage.osni_street_point": NARROW_STAGE_INSERT_BATCH_SIZE,
+    "stage.dfi_road_segment": NARROW_STAGE_INSERT_BATCH_SIZE,
+    "stage.ppd_parsed_address": NARROW_STAGE_INSERT_BATCH_SIZE,
+}
+
+
+def _stage_insert_batch_size(table: str) -> int:
+    return STAGE_INSERT_BATCH_SIZE_BY_TABLE.get(table, STAGE_INSERT_BATCH_SIZE)
 
 
 def _iter_validated_raw_rows(
@@ -529,7 +575,7 @@ def _iter_validated_raw_rows(
 ):
     schema_name, table_name = raw_table.split(".", 1)
     cursor_name = f"stage_raw_{table_name}_{uuid.uuid4().hex[:8]}"
-    with conn.cursor(name=cursor_name) as cur:
+    with conn.cursor(name=cursor_name, binary=True, row_factory=tuple_row) as cur:
         cur.itersize = RAW_FETCH_BATCH_SIZE
         cur.execute(
             sql.SQL(
@@ -557,12 +603,9 @@ def _iter_validated_raw_rows(
         )
         yield first_row
 
-        while True:
-            chunk = cur.fetchmany(RAW_FETCH_BATCH_SIZE)
-            if not chunk:
-                break
-            for row in chunk:
-                yield row[0]
+        # Iterating a named cursor fetches itersize rows per round trip.
+        for (payload,) in cur:
+            yield payload
 
 
 def _iter_validated_raw_rows_with_rownum(
@@ -576,7 +619,8 @@ def _iter_validated_raw_rows_with_rownum(
 ):
     schema_name, table_name = raw_table.split(".", 1)
     cursor_name = f"stage_raw_num_{table_name}_{uuid.uuid4().hex[:8]}"
-    with conn.cursor(name=cursor_name) as cur:
+    # Binary results return source_row_num as native int8 instead of decimal text.
+    with conn.cursor(name=cursor_name, binary=True, row_factory=tuple_row) as cur:
         cur.itersize = RAW_FETCH_BATCH_SIZE
         cur.execute(
             sql.SQL(
@@ -603,12 +647,8 @@ def _iter_validated_raw_rows_with_rownum(
         )
         yield int(first[0]), first[1]
 
-        while True:
-            chunk = cur.fetchmany(RAW_FETCH_BATCH_SIZE)
-            if not chunk:
-                break
-            for row in chunk:
-                yield int(row[0]), row[1]
+        for source_row_num, payload in cur:
+            yield int(source_row_num), payload
 
 
 def _mapped_fields_for_source(schema_config: dict[str, Any], source_name: str) -> tuple[dict[str, str], tuple[str, ...]]:
@@ -733,18 +773,28 @@ def _field_name_candidates(field_map: dict[str, str], logical_key: str) -> tuple
     return tuple(deduped)
 
 
-def _field_value(row: dict[str, Any], field_map: dict[str, str], logical_key: str) -> Any:
-    for candidate in _field_name_candidates(field_map, logical_key):
-        if candidate in row:
-            return row.get(candidate)
-    return None
+def _field_resolver(
+    field_map: dict[str, str],
+    logical_keys: tuple[str, ...],
+) -> Callable[[dict[str, Any], str], Any]:
+    # Candidate names depend only on the mapping, so resolve them once per source
+    # instead of rebuilding alias/case variants for every raw row.
+    candidates_by_key = {key: _field_name_candidates(field_map, key) for key in logical_keys}
+
+    def resolve(row: dict[str, Any], logical_key: str) -> Any:
+        for candidate in candidates_by_key[logical_key]:
+            if candidate in row:
+                return row[candidate]
+        return None
+
+    return resolve
 
 
 def _postcode_district_norm(value: str | None) -> str | None:
     text = (value or "").strip()
     if text == "":
         return None
-    normalized = re.sub(r"[^A-Za-z0-9]", "", text.upper())
+    normalized = NON_ALPHANUMERIC_RE.sub("", text.upper())
     return normalized or None
 
 
@@ -818,6 +868,9 @@ def _open_names_family_rule(
     return family_rules["__default__"]
 
 
+# Open Names has a few dozen distinct LOCAL_TYPE values, so the substring rule is
+# evaluated once per value rather than once per feature row.
+@lru_cache(maxsize=256)
 def _is_open_names_road_local_type(local_type: str) -> bool:
     return "road" in local_type or "transport" in local_type
 
@@ -882,6 +935,10 @@ def _schema_insert_rows(
 ) -> int:
     if not rows:
         return 0
+    # psycopg 3 pipelines executemany, so a batch costs one network flush rather than
+    # one round-trip per row. Folding rows into a multi-row VALUES statement is not
+    # used: a repeated conflict key within one ON CONFLICT DO UPDATE statement errors,
+    # whereas per-row execution preserves the row-order upsert semantics.
     with conn.cursor() as cur:
         cur.executemany(query, rows)
     return len(rows)
@@ -890,15 +947,54 @@ def _schema_insert_rows(
 def _flush_stage_batch(
     conn: psycopg.Connection,
     query: sql.SQL,
-    payload: list[tuple[Any, ...]],
+    payload: list[tuple[Any, ...]] | dict[Any, tuple[Any, ...]],
 ) -> int:
     if not payload:
         return 0
-    inserted = _schema_insert_rows(conn, query, payload)
+    # Keyed payloads hold one row per conflict key, already merged last-wins.
+    rows = list(payload.values()) if isinstance(payload, dict) else payload
+    inserted = _schema_insert_rows(conn, query, rows)
     payload.clear()
     return inserted
 
 
+def _copy_stage_batch(
+    conn: psycopg.Connection,
+    target: StageCopyTarget,
+    payload: dict[Any, tuple[Any, ...]],
+) -> int:
+    if not payload:
+        return 0
+    # Keyed payloads hold exactly one row per conflict key, so the whole batch can be
+    # merged by a single INSERT ... SELECT without hitting the same row twice.
+    rows = list(payload.values())
+    schema_name, table_name = target.table_name.split(".", 1)
+    target_ident = sql.Identifier(schema_name, table_name)
+    temp_ident = sql.Identifier(f"tmp_copy_{table_name}")
+    column_list = sql.SQL(", ").join(sql.Identifier(column) for column in target.columns)
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL(
+                "CREATE TEMP TABLE IF NOT EXISTS {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA"
+            ).format(temp_ident, column_list, target_ident)
+        )
+        cur.execute(sql.SQL("TRUNCATE {}").format(temp_ident))
+        with cur.copy(sql.SQL("COPY {} ({}) FROM STDIN").format(temp_ident, column_list)) as copy:
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(
+            sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} {}").format(
+                target_ident,
+                column_list,
+                column_list,
+                temp_ident,
+                sql.SQL(target.conflict_sql),
+            )
+        )
+    payload.clear()
+    return len(rows)
+
+
 STAGE_TABLES = (
     "stage.open_names_other",
     "stage.open_names_hydrography",
@@ -983,72 +1079,71 @@ def _pass_0a_raw_ingest(
     source_runs: dict[str, tuple[str, ...]],
 ) -> dict[str, int]:
     del build_run_id  # Pass 0a validates bundle/run metadata only.
-    counts: dict[str, int] = {}
+    all_run_ids = sorted({run_id for run_ids in source_runs.values() for run_id in run_ids})
     with conn.cursor() as cur:
-        for source_name, run_ids in sorted(source_runs.items()):
-            total_row_count = 0
-            for ingest_run_id in run_ids:
-                cur.execute(
-                    """
-                    SELECT source_name, record_count
-                    FROM meta.ingest_run
-                    WHERE run_id = %s
-                    """,
-                    (ingest_run_id,),
+        cur.execute(
+            """
+            SELECT run_id::text, source_name, record_count
+            FROM meta.ingest_run
+            WHERE run_id = ANY(%s::uuid[])
+            """,
+            (all_run_ids,),
+        )
+        run_metadata = {str(row[0]): (row[1], row[2]) for row in cur.fetchall()}
+
+    counts: dict[str, int] = {}
+    for source_name, run_ids in sorted(source_runs.items()):
+        total_row_count = 0
+        for ingest_run_id in run_ids:
+            row = run_metadata.get(str(uuid.UUID(ingest_run_id)))
+            if row is None:
+                raise BuildError(
+                    f"Pass 0a failed: ingest run missing in metadata source={source_name} run={ingest_run_id}"
                 )
-                row = cur.fetchone()
-                if row is None:
-                    raise BuildError(
-                        f"Pass 0a failed: ingest run missing in metadata source={source_name} run={ingest_run_id}"
-                    )
-                row_source_name, record_count = row
-                if row_source_name != source_name:
-                    raise BuildError(
-                        "Pass 0a failed: ingest run/source mismatch "
-                        f"bundle_source={source_name} run_source={row_source_name} run={ingest_run_id}"
-                    )
-                row_count = int(record_count or 0)
-                if row_count <= 0:
-                    raise BuildError(
-                        "Pass 0a failed: source has no recorded rows for "
-                        f"source={source_name} run={ingest_run_id}"
-                    )
-                total_row_count += row_count
-            counts[source_name] = total_row_count
+            row_source_name, record_count = row
+            if row_source_name != source_name:
+                raise BuildError(
+                    "Pass 0a failed: ingest run/source mismatch "
+                    f"bundle_source={source_name} run_source={row_source_name} run={ingest_run_id}"
+                )
+            row_count = int(record_count or 0)
+            if row_count <= 0:
+                raise BuildError(
+                    "Pass 0a failed: source has no recorded rows for "
+                    f"source={source_name} run={ingest_run_id}"
+                )
+            total_row_count += row_count
+        counts[source_name] = total_row_count
     return counts
 
 
-def _country_enrichment_available(country_iso2: str, subdivision_code: str | None) -> bool:
-    if subdivision_code in {"GB-ENG", "GB-SCT", "GB-WLS", "GB-NIR"}:
-        return True
-    if country_iso2 == "GB":
-        return True
-    return False
+GB_SUBDIVISION_CODES = frozenset({"GB-ENG", "GB-SCT", "GB-WLS", "GB-NIR"})
+ONSPD_COUNTRY_MAPPING = {
+    "E92000001": ("GB", "GBR", "GB-ENG"),
+    "S92000003": ("GB", "GBR", "GB-SCT"),
+    "W92000004": ("GB", "GBR", "GB-WLS"),
+    "N92000002": ("GB", "GBR", "GB-NIR"),
+}
+ONSPD_COUNTRY_FALLBACK = ("GB", "GBR", None)
+NUMERIC_TEXT_PATTERN = r"^[+-]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][+-]?[0-9]+)?$"
 
 
-def _onspd_country_mapping(value: str | None) -> tuple[str, str, str | None]:
-    code = (value or "").strip().upper()
-    mapping = {
-        "E92000001": ("GB", "GBR", "GB-ENG"),
-        "S92000003": ("GB", "GBR", "GB-SCT"),
-        "W92000004": ("GB", "GBR", "GB-WLS"),
-        "N92000002": ("GB", "GBR", "GB-NIR"),
-    }
-    if code in mapping:
-        return mapping[code]
-    if code in {"GB", "GBR"}:
-        return "GB", "GBR", None
-    return "GB", "GBR", None
+def _onspd_country_case_sql(code_expr: sql.Composable, position: int) -> sql.Composed:
+    branches = [
+        sql.SQL("WHEN {} THEN {}").format(sql.Literal(code), sql.Literal(mapped[position]))
+        for code, mapped in sorted(ONSPD_COUNTRY_MAPPING.items())
+    ]
+    return sql.SQL("CASE {} {} ELSE {} END").format(
+        code_expr,
+        sql.SQL(" ").join(branches),
+        sql.Literal(ONSPD_COUNTRY_FALLBACK[position]),
+    )
 
 
-def _normalise_onspd_status(value: str | None) -> str:
-    raw = (value or "").strip()
-    if raw == "":
-        return "active"
-    lowered = raw.lower()
-    if lowered in {"active", "terminated"}:
-        return lowered
-    return "terminated"
+def _raw_key_text(payload_expr: sql.SQL, key: str | None) -> sql.Composable:
+    if not key:
+        return sql.SQL("NULL::text")
+    return sql.SQL("({} ->> {})").format(payload_expr, sql.Literal(key))
 
 
 def _populate_stage_onspd(
@@ -1058,116 +1153,145 @@ def _populate_stage_onspd(
     field_map: dict[str, str],
     required_fields: tuple[str, ...],
 ) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.onspd_postcode (
-            build_run_id,
-            postcode_norm,
-            postcode_display,
-            status,
-            lat,
-            lon,
-            easting,
-            northing,
-            country_iso2,
-            country_iso3,
-            subdivision_code,
-            street_enrichment_available,
-            onspd_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-    )
-
-    payload: list[tuple[Any, ...]] = []
-    inserted = 0
-    for row in _iter_validated_raw_rows(
+    _validated_raw_sample_row(
         conn,
         source_name="onspd",
         raw_table="raw.onspd_row",
         ingest_run_id=ingest_run_id,
         field_map=field_map,
         required_fields=required_fields,
-    ):
-        postcode_raw = _field_value(row, field_map, "postcode")
-        postcode_n = postcode_norm(str(postcode_raw) if postcode_raw is not None else None)
-        postcode_d = postcode_display(str(postcode_raw) if postcode_raw is not None else None)
-        if postcode_n is None or postcode_d is None:
-            continue
-
-        status_key = field_map.get("status")
-        status = _normalise_onspd_status(
-            str(row.get(status_key)) if status_key and row.get(status_key) is not None else None
-        )
-
-        country_key = field_map.get("subdivision_code") or field_map.get("country_iso2")
-        mapped_country_value = (
-            str(row.get(country_key)) if country_key and row.get(country_key) is not None else None
-        )
-        country_iso2, country_iso3, subdivision_code = _onspd_country_mapping(mapped_country_value)
-
-        lat_raw = _field_value(row, field_map, "lat")
-        lon_raw = _field_value(row, field_map, "lon")
-        easting_raw = _field_value(row, field_map, "easting")
-        northing_raw = _field_value(row, field_map, "northing")
-
-        lat: Decimal | None
-        lon: Decimal | None
-        try:
-            lat = Decimal(str(lat_raw)).quantize(Decimal("0.000001")) if lat_raw not in (None, "") else None
-            lon = Decimal(str(lon_raw)).quantize(Decimal("0.000001")) if lon_raw not in (None, "") else None
-        except Exception:
-            lat = None
-            lon = None
+    )
 
-        try:
-            easting = int(float(easting_raw)) if easting_raw not in (None, "") else None
-            northing = int(float(northing_raw)) if northing_raw not in (None, "") else None
-        except Exception:
-            easting = None
-            northing = None
+    payload_expr = sql.SQL("r.payload_jsonb")
+    postcode_expr = _json_text_for_field(payload_expr, field_map, "postcode")
+    lat_expr = _json_text_for_field(payload_expr, field_map, "lat")
+    lon_expr = _json_text_for_field(payload_expr, field_map, "lon")
+    easting_expr = _json_text_for_field(payload_expr, field_map, "easting")
+    northing_expr = _json_text_for_field(payload_expr, field_map, "northing")
+    status_expr = _raw_key_text(payload_expr, field_map.get("status"))
+    country_expr = _raw_key_text(
+        payload_expr,
+        field_map.get("subdivision_code") or field_map.get("country_iso2"),
+    )
+    country_code = sql.SQL("e.country_code")
 
-        payload.append(
-            (
-                build_run_id,
-                postcode_n,
-                postcode_d,
-                status,
-                lat,
-                lon,
-                easting,
-                northing,
-                country_iso2,
-                country_iso3,
-                subdivision_code,
-                _country_enrichment_available(country_iso2, subdivision_code),
-                ingest_run_id,
-            )
+    # Mirrors the former Python row normaliser: an unparsable lat/lon (or
+    # easting/northing) nulls both values of the pair.
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL(
+                """
+                WITH extracted AS (
+                    SELECT
+                        core.postcode_norm({postcode_expr}) AS postcode_norm,
+                        btrim({status_expr}) AS status_text,
+                        upper(btrim(COALESCE({country_expr}, ''))) AS country_code,
+                        {lat_expr} AS lat_text,
+                        {lon_expr} AS lon_text,
+                        {easting_expr} AS easting_text,
+                        {northing_expr} AS northing_text
+                    FROM raw.onspd_row AS r
+                    WHERE r.ingest_run_id = %s
+                ),
+                typed AS (
+                    SELECT
+                        e.postcode_norm,
+                        CASE
+                            WHEN COALESCE(e.status_text, '') = '' THEN 'active'
+                            WHEN lower(e.status_text) IN ('active', 'terminated') THEN lower(e.status_text)
+                            ELSE 'terminated'
+                        END AS status,
+                        CASE
+                            WHEN (COALESCE(e.lat_text, '') = '' OR btrim(e.lat_text) ~ {numeric_pattern})
+                             AND (COALESCE(e.lon_text, '') = '' OR btrim(e.lon_text) ~ {numeric_pattern})
+                            THEN NULLIF(e.lat_text, '')::numeric
+                        END AS lat,
+                        CASE
+                            WHEN (COALESCE(e.lat_text, '') = '' OR btrim(e.lat_text) ~ {numeric_pattern})
+                             AND (COALESCE(e.lon_text, '') = '' OR btrim(e.lon_text) ~ {numeric_pattern})
+                            THEN NULLIF(e.lon_text, '')::numeric
+                        END AS lon,
+                        CASE
+                            WHEN (COALESCE(e.easting_text, '') = '' OR btrim(e.easting_text) ~ {numeric_pattern})
+                             AND (COALESCE(e.northing_text, '') = '' OR btrim(e.northing_text) ~ {numeric_pattern})
+                            THEN trunc(NULLIF(e.easting_text, '')::numeric)::integer
+                        END AS easting,
+                        CASE
+                            WHEN (COALESCE(e.easting_text, '') = '' OR btrim(e.easting_text) ~ {numeric_pattern})
+                             AND (COALESCE(e.northing_text, '') = '' OR btrim(e.northing_text) ~ {numeric_pattern})
+                            THEN trunc(NULLIF(e.northing_text, '')::numeric)::integer
+                        END AS northing,
+                        {country_iso2_case} AS country_iso2,
+                        {country_iso3_case} AS country_iso3,
+                        {subdivision_case} AS subdivision_code
+                    FROM extracted AS e
+                    WHERE e.postcode_norm IS NOT NULL
+                )
+                INSERT INTO stage.onspd_postcode (
+                    build_run_id,
+                    postcode_norm,
+                    postcode_display,
+                    status,
+                    lat,
+                    lon,
+                    easting,
+                    northing,
+                    country_iso2,
+                    country_iso3,
+                    subdivision_code,
+                    street_enrichment_available,
+                    onspd_run_id
+                )
+                SELECT
+                    %s,
+                    t.postcode_norm,
+                    CASE
+                        WHEN length(t.postcode_norm) <= 3 THEN t.postcode_norm
+                        ELSE left(t.postcode_norm, -3) || ' ' || right(t.postcode_norm, 3)
+                    END,
+                    t.status,
+                    t.lat,
+                    t.lon,
+                    t.easting,
+                    t.northing,
+                    t.country_iso2,
+                    t.country_iso3,
+                    t.subdivision_code,
+                    (t.country_iso2 = 'GB' OR t.subdivision_code IN ({gb_subdivisions})),
+                    %s
+                FROM typed AS t
+                """
+            ).format(
+                postcode_expr=postcode_expr,
+                status_expr=status_expr,
+                country_expr=country_expr,
+                lat_expr=lat_expr,
+                lon_expr=lon_expr,
+                easting_expr=easting_expr,
+                northing_expr=northing_expr,
+                numeric_pattern=sql.Literal(NUMERIC_TEXT_PATTERN),
+                country_iso2_case=_onspd_country_case_sql(country_code, 0),
+                country_iso3_case=_onspd_country_case_sql(country_code, 1),
+                subdivision_case=_onspd_country_case_sql(country_code, 2),
+                gb_subdivisions=sql.SQL(", ").join(sql.Literal(code) for code in sorted(GB_SUBDIVISION_CODES)),
+            ),
+            (ingest_run_id, build_run_id, ingest_run_id),
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
-
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
-    return inserted
+        return int(cur.rowcount)
 
 
-def _populate_stage_usrn(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.streets_usrn_input (
-            build_run_id,
-            usrn,
-            street_name,
-            street_name_casefolded,
-            street_type,
-            street_status,
-            usrn_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+STAGE_USRN_COPY = StageCopyTarget(
+    table_name="stage.streets_usrn_input",
+    columns=(
+        "build_run_id",
+        "usrn",
+        "street_name",
+        "street_name_casefolded",
+        "street_type",
+        "street_status",
+        "usrn_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, usrn)
         DO UPDATE SET
             street_name = COALESCE(EXCLUDED.street_name, stage.streets_usrn_input.street_name),
@@ -1178,10 +1302,20 @@ def _populate_stage_usrn(
             street_type = COALESCE(EXCLUDED.street_type, stage.streets_usrn_input.street_type),
             street_status = COALESCE(EXCLUDED.street_status, stage.streets_usrn_input.street_status),
             usrn_run_id = EXCLUDED.usrn_run_id
-        """
-    )
+    """,
+)
 
-    payload: list[tuple[Any, ...]] = []
+
+def _populate_stage_usrn(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> int:
+    field_value = _field_resolver(field_map, ("usrn", "street_name", "street_type", "street_status"))
+    batch_size = _stage_insert_batch_size("stage.streets_usrn_input")
+    payload: dict[int, tuple[Any, ...]] = {}
     inserted = 0
     for row in _iter_validated_raw_rows(
         conn,
@@ -1191,8 +1325,8 @@ def _populate_stage_usrn(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        usrn_raw = _field_value(row, field_map, "usrn")
-        name_raw = _field_value(row, field_map, "street_name")
+        usrn_raw = field_value(row, "usrn")
+        name_raw = field_value(row, "street_name")
         if usrn_raw in (None, ""):
             continue
         try:
@@ -1205,8 +1339,8 @@ def _populate_stage_usrn(
             street_name_value = None
             folded = None
 
-        street_type_raw = _field_value(row, field_map, "street_type")
-        street_status_raw = _field_value(row, field_map, "street_status")
+        street_type_raw = field_value(row, "street_type")
+        street_status_raw = field_value(row, "street_status")
         street_type_value = text_or_none(street_type_raw)
         street_status_value = text_or_none(street_status_raw)
         if street_type_value is not None:
@@ -1216,91 +1350,94 @@ def _populate_stage_usrn(
         if street_name_value is None and street_type_value is None and street_status_value is None:
             continue
 
-        payload.append(
-            (
-                build_run_id,
-                usrn,
-                street_name_value,
-                folded,
-                street_type_value,
-                street_status_value,
-                ingest_run_id,
-            )
+        previous = payload.get(usrn)
+        if previous is not None:
+            # Same COALESCE merge as the ON CONFLICT clause, applied client-side.
+            if street_name_value is None:
+                street_name_value, folded = previous[2], previous[3]
+            if street_type_value is None:
+                street_type_value = previous[4]
+            if street_status_value is None:
+                street_status_value = previous[5]
+        payload[usrn] = (
+            build_run_id,
+            usrn,
+            street_name_value,
+            folded,
+            street_type_value,
+            street_status_value,
+            ingest_run_id,
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
+        inserted += 1
+        if len(payload) >= batch_size:
+            _copy_stage_batch(conn, STAGE_USRN_COPY, payload)
 
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
+    _copy_stage_batch(conn, STAGE_USRN_COPY, payload)
     return inserted
 
 
-def _populate_stage_open_names(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> tuple[int, int, int, dict[str, int]]:
-    road_insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.open_names_road_feature (
-            build_run_id,
-            feature_id,
-            toid,
-            related_toid,
-            feature_toid,
-            postcode_norm,
-            postcode_district_norm,
-            street_name_raw,
-            street_name_casefolded,
-            geom_bng,
-            ingest_run_id
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            CASE
-                WHEN %s IS NULL THEN NULL
-                ELSE ST_GeomFromText(%s, 27700)
-            END,
-            %s
-        )
-        ON CONFLICT (build_run_id, feature_id)
-        DO UPDATE SET
-            toid = EXCLUDED.toid,
-            related_toid = EXCLUDED.related_toid,
-            feature_toid = EXCLUDED.feature_toid,
-            postcode_norm = EXCLUDED.postcode_norm,
-            postcode_district_norm = EXCLUDED.postcode_district_norm,
-            street_name_raw = EXCLUDED.street_name_raw,
-            street_name_casefolded = EXCLUDED.street_name_casefolded,
-            geom_bng = EXCLUDED.geom_bng,
-            ingest_run_id = EXCLUDED.ingest_run_id
-        """
+STAGE_OPEN_NAMES_ROAD_INSERT_SQL = sql.SQL(
+    """
+    INSERT INTO stage.open_names_road_feature (
+        build_run_id,
+        feature_id,
+        toid,
+        related_toid,
+        feature_toid,
+        postcode_norm,
+        postcode_district_norm,
+        street_name_raw,
+        street_name_casefolded,
+        geom_bng,
+        ingest_run_id
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s,
+        CASE
+            WHEN %s IS NULL THEN NULL
+            ELSE ST_GeomFromText(%s, 27700)
+        END,
+        %s
     )
+    ON CONFLICT (build_run_id, feature_id)
+    DO UPDATE SET
+        toid = EXCLUDED.toid,
+        related_toid = EXCLUDED.related_toid,
+        feature_toid = EXCLUDED.feature_toid,
+        postcode_norm = EXCLUDED.postcode_norm,
+        postcode_district_norm = EXCLUDED.postcode_district_norm,
+        street_name_raw = EXCLUDED.street_name_raw,
+        street_name_casefolded = EXCLUDED.street_name_casefolded,
+        geom_bng = EXCLUDED.geom_bng,
+        ingest_run_id = EXCLUDED.ingest_run_id
+    """
+)
 
-    postcode_insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.open_names_postcode_feature (
-            build_run_id,
-            source_row_num,
-            feature_id,
-            postcode_norm,
-            postcode_display,
-            populated_place,
-            place_type,
-            place_toid,
-            district_borough,
-            district_borough_type,
-            district_borough_toid,
-            county_unitary,
-            county_unitary_type,
-            county_unitary_toid,
-            region,
-            region_toid,
-            country,
-            geometry_x,
-            geometry_y,
-            ingest_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+
+STAGE_OPEN_NAMES_POSTCODE_COPY = StageCopyTarget(
+    table_name="stage.open_names_postcode_feature",
+    columns=(
+        "build_run_id",
+        "source_row_num",
+        "feature_id",
+        "postcode_norm",
+        "postcode_display",
+        "populated_place",
+        "place_type",
+        "place_toid",
+        "district_borough",
+        "district_borough_type",
+        "district_borough_toid",
+        "county_unitary",
+        "county_unitary_type",
+        "county_unitary_toid",
+        "region",
+        "region_toid",
+        "country",
+        "geometry_x",
+        "geometry_y",
+        "ingest_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, source_row_num)
         DO UPDATE SET
             feature_id = EXCLUDED.feature_id,
@@ -1321,11 +1458,19 @@ def _populate_stage_open_names(
             geometry_x = EXCLUDED.geometry_x,
             geometry_y = EXCLUDED.geometry_y,
             ingest_run_id = EXCLUDED.ingest_run_id
-        """
-    )
+    """,
+)
+
 
-    road_payload: list[tuple[Any, ...]] = []
-    postcode_payload: list[tuple[Any, ...]] = []
+def _populate_stage_open_names(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> tuple[int, int, int, dict[str, int]]:
+    road_payload: dict[str, tuple[Any, ...]] = {}
+    postcode_payload: dict[int, tuple[Any, ...]] = {}
     family_rules = _open_names_family_rules()
     family_tables = sorted(
         {
@@ -1393,6 +1538,33 @@ def _populate_stage_open_names(
     road_inserted = 0
     postcode_inserted = 0
 
+    field_value = _field_resolver(
+        field_map,
+        (
+            "feature_id",
+            "street_name",
+            "local_type",
+            "geometry_x",
+            "geometry_y",
+            "populated_place",
+            "populated_place_type",
+            "populated_place_uri",
+            "district_borough",
+            "district_borough_type",
+            "district_borough_uri",
+            "county_unitary",
+            "county_unitary_type",
+            "county_unitary_uri",
+            "region",
+            "region_uri",
+            "country",
+            "postcode",
+            "toid",
+            "postcode_district",
+            "type",
+            "street_name_alt",
+        ),
+    )
     for source_row_num, row in _iter_validated_raw_rows_with_rownum(
         conn,
         source_name="os_open_names",
@@ -1401,34 +1573,34 @@ def _populate_stage_open_names(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        feature_id_raw = _field_value(row, field_map, "feature_id")
-        name1_raw = _field_value(row, field_map, "street_name")
+        feature_id_raw = field_value(row, "feature_id")
+        name1_raw = field_value(row, "street_name")
         if feature_id_raw in (None, "") or name1_raw in (None, ""):
             continue
 
-        local_type_raw = _field_value(row, field_map, "local_type")
+        local_type_raw = field_value(row, "local_type")
         local_type = str(local_type_raw).strip().lower() if local_type_raw not in (None, "") else ""
 
-        geometry_x_raw = _field_value(row, field_map, "geometry_x")
-        geometry_y_raw = _field_value(row, field_map, "geometry_y")
+        geometry_x_raw = field_value(row, "geometry_x")
+        geometry_y_raw = field_value(row, "geometry_y")
         geom_wkt = _geom_point_wkt(geometry_x_raw, geometry_y_raw)
 
         if local_type == "postcode":
             postcode_d = postcode_display(str(name1_raw))
             postcode_n = postcode_norm(str(name1_raw))
             if postcode_d is not None and postcode_n is not None:
-                populated_place_raw = _field_value(row, field_map, "populated_place")
-                populated_place_type_raw = _field_value(row, field_map, "populated_place_type")
-                populated_place_uri_raw = _field_value(row, field_map, "populated_place_uri")
-                district_borough_raw = _field_value(row, field_map, "district_borough")
-                district_borough_type_raw = _field_value(row, field_map, "district_borough_type")
-                district_borough_uri_raw = _field_value(row, field_map, "district_borough_uri")
-                county_unitary_raw = _field_value(row, field_map, "county_unitary")
-                county_unitary_type_raw = _field_value(row, field_map, "county_unitary_type")
-                county_unitary_uri_raw = _field_value(row, field_map, "county_unitary_uri")
-                region_raw = _field_value(row, field_map, "region")
-                region_uri_raw = _field_value(row, field_map, "region_uri")
-                country_raw = _field_value(row, field_map, "country")
+                populated_place_raw = field_value(row, "populated_place")
+                populated_place_type_raw = field_value(row, "populated_place_type")
+                populated_place_uri_raw = field_value(row, "populated_place_uri")
+                district_borough_raw = field_value(row, "district_borough")
+                district_borough_type_raw = field_value(row, "district_borough_type")
+                district_borough_uri_raw = field_value(row, "district_borough_uri")
+                county_unitary_raw = field_value(row, "county_unitary")
+                county_unitary_type_raw = field_value(row, "county_unitary_type")
+                county_unitary_uri_raw = field_value(row, "county_unitary_uri")
+                region_raw = field_value(row, "region")
+                region_uri_raw = field_value(row, "region_uri")
+                country_raw = field_value(row, "country")
                 try:
                     geometry_x = int(float(geometry_x_raw)) if geometry_x_raw not in (None, "") else None
                 except Exception:
@@ -1438,44 +1610,43 @@ def _populate_stage_open_names(
                 except Exception:
                     geometry_y = None
 
-                postcode_payload.append(
-                    (
-                        build_run_id,
-                        source_row_num,
-                        str(feature_id_raw).strip(),
-                        postcode_n,
-                        postcode_d,
-                        text_or_none(populated_place_raw),
-                        uri_fragment_or_terminal(
-                            str(populated_place_type_raw) if populated_place_type_raw is not None else None
-                        ),
-                        uri_terminal_segment(
-                            str(populated_place_uri_raw) if populated_place_uri_raw is not None else None
-                        ),
-                        text_or_none(district_borough_raw),
-                        uri_terminal_segment(
-                            str(district_borough_type_raw) if district_borough_type_raw is not None else None
-                        ),
-                        uri_terminal_segment(
-                            str(district_borough_uri_raw) if district_borough_uri_raw is not None else None
-                        ),
-                        text_or_none(county_unitary_raw),
-                        uri_terminal_segment(
-                            str(county_unitary_type_raw) if county_unitary_type_raw is not None else None
-                        ),
-                        uri_terminal_segment(
-                            str(county_unitary_uri_raw) if county_unitary_uri_raw is not None else None
-                        ),
-                        text_or_none(region_raw),
-                        uri_terminal_segment(str(region_uri_raw) if region_uri_raw is not None else None),
-                        text_or_none(country_raw),
-                        geometry_x,
-                        geometry_y,
-                        ingest_run_id,
-                    )
+                postcode_payload[source_row_num] = (
+                    build_run_id,
+                    source_row_num,
+                    str(feature_id_raw).strip(),
+                    postcode_n,
+                    postcode_d,
+                    text_or_none(populated_place_raw),
+                    uri_fragment_or_terminal(
+                        str(populated_place_type_raw) if populated_place_type_raw is not None else None
+                    ),
+                    uri_terminal_segment(
+                        str(populated_place_uri_raw) if populated_place_uri_raw is not None else None
+                    ),
+                    text_or_none(district_borough_raw),
+                    uri_terminal_segment(
+                        str(district_borough_type_raw) if district_borough_type_raw is not None else None
+                    ),
+                    uri_terminal_segment(
+                        str(district_borough_uri_raw) if district_borough_uri_raw is not None else None
+                    ),
+                    text_or_none(county_unitary_raw),
+                    uri_terminal_segment(
+                        str(county_unitary_type_raw) if county_unitary_type_raw is not None else None
+                    ),
+                    uri_terminal_segment(
+                        str(county_unitary_uri_raw) if county_unitary_uri_raw is not None else None
+                    ),
+                    text_or_none(region_raw),
+                    uri_terminal_segment(str(region_uri_raw) if region_uri_raw is not None else None),
+                    text_or_none(country_raw),
+                    geometry_x,
+                    geometry_y,
+                    ingest_run_id,
                 )
+                postcode_inserted += 1
                 if len(postcode_payload) >= STAGE_INSERT_BATCH_SIZE:
-                    postcode_inserted += _flush_stage_batch(conn, postcode_insert_sql, postcode_payload)
+                    _copy_stage_batch(conn, STAGE_OPEN_NAMES_POSTCODE_COPY, postcode_payload)
             continue
 
         if _is_open_names_road_local_type(local_type):
@@ -1483,43 +1654,43 @@ def _populate_stage_open_names(
             if folded is None:
                 continue
 
-            postcode_raw = _field_value(row, field_map, "postcode")
-            toid_raw = _field_value(row, field_map, "toid")
-            postcode_district_raw = _field_value(row, field_map, "postcode_district")
+            postcode_raw = field_value(row, "postcode")
+            toid_raw = field_value(row, "toid")
+            postcode_district_raw = field_value(row, "postcode_district")
             postcode_n = postcode_norm(str(postcode_raw) if postcode_raw is not None else None)
             related_toid = text_or_none(str(toid_raw) if toid_raw is not None else None)
 
-            road_payload.append(
-                (
-                    build_run_id,
-                    str(feature_id_raw).strip(),
-                    related_toid,
-                    related_toid,
-                    str(feature_id_raw).strip(),
-                    postcode_n,
-                    _postcode_district_norm(
-                        str(postcode_district_raw) if postcode_district_raw is not None else None
-                    ),
-                    str(name1_raw).strip(),
-                    folded,
-                    geom_wkt,
-                    geom_wkt,
-                    ingest_run_id,
-                )
+            feature_id = str(feature_id_raw).strip()
+            road_payload[feature_id] = (
+                build_run_id,
+                feature_id,
+                related_toid,
+                related_toid,
+                feature_id,
+                postcode_n,
+                _postcode_district_norm(
+                    str(postcode_district_raw) if postcode_district_raw is not None else None
+                ),
+                str(name1_raw).strip(),
+                folded,
+                geom_wkt,
+                geom_wkt,
+                ingest_run_id,
             )
+            road_inserted += 1
             if len(road_payload) >= STAGE_INSERT_BATCH_SIZE:
-                road_inserted += _flush_stage_batch(conn, road_insert_sql, road_payload)
+                _flush_stage_batch(conn, STAGE_OPEN_NAMES_ROAD_INSERT_SQL, road_payload)
             continue
 
-        type_raw = _field_value(row, field_map, "type")
-        name2_raw = _field_value(row, field_map, "street_name_alt")
-        postcode_district_raw = _field_value(row, field_map, "postcode_district")
-        populated_place_raw = _field_value(row, field_map, "populated_place")
-        district_borough_raw = _field_value(row, field_map, "district_borough")
-        county_unitary_raw = _field_value(row, field_map, "county_unitary")
-        region_raw = _field_value(row, field_map, "region")
-        country_raw = _field_value(row, field_map, "country")
-        toid_raw = _field_value(row, field_map, "toid")
+        type_raw = field_value(row, "type")
+        name2_raw = field_value(row, "street_name_alt")
+        postcode_district_raw = field_value(row, "postcode_district")
+        populated_place_raw = field_value(row, "populated_place")
+        district_borough_raw = field_value(row, "district_borough")
+        county_unitary_raw = field_value(row, "county_unitary")
+        region_raw = field_value(row, "region")
+        country_raw = field_value(row, "country")
+        toid_raw = field_value(row, "toid")
 
         type_text = text_or_none(str(type_raw) if type_raw is not None else None) or "other"
         family_table, linkage_policy = _open_names_family_rule(type_text, family_rules)
@@ -1554,8 +1725,8 @@ def _populate_stage_open_names(
                 feature_payloads[family_table],
             )
 
-    road_inserted += _flush_stage_batch(conn, road_insert_sql, road_payload)
-    postcode_inserted += _flush_stage_batch(conn, postcode_insert_sql, postcode_payload)
+    _flush_stage_batch(conn, STAGE_OPEN_NAMES_ROAD_INSERT_SQL, road_payload)
+    _copy_stage_batch(conn, STAGE_OPEN_NAMES_POSTCODE_COPY, postcode_payload)
     for table_name in family_tables:
         feature_inserted[table_name] += _flush_stage_batch(
             conn,
@@ -1586,26 +1757,19 @@ def _populate_stage_open_names(
     return road_inserted, postcode_inserted, duplicate_postcode_keys, family_counts
 
 
-def _populate_stage_open_roads(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.open_roads_segment (
-            build_run_id,
-            segment_id,
-            road_id,
-            postcode_norm,
-            usrn,
-            road_name,
-            road_name_casefolded,
-            geom_bng,
-            ingest_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, NULL, %s)
+STAGE_OPEN_ROADS_COPY = StageCopyTarget(
+    table_name="stage.open_roads_segment",
+    columns=(
+        "build_run_id",
+        "segment_id",
+        "road_id",
+        "postcode_norm",
+        "usrn",
+        "road_name",
+        "road_name_casefolded",
+        "ingest_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, segment_id)
         DO UPDATE SET
             road_id = EXCLUDED.road_id,
@@ -1615,11 +1779,30 @@ def _populate_stage_open_roads(
             road_name_casefolded = EXCLUDED.road_name_casefolded,
             geom_bng = EXCLUDED.geom_bng,
             ingest_run_id = EXCLUDED.ingest_run_id
-        """
-    )
+    """,
+)
 
-    payload: list[tuple[Any, ...]] = []
+
+def _populate_stage_open_roads(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> int:
+    batch_size = _stage_insert_batch_size("stage.open_roads_segment")
+    payload: dict[str, tuple[Any, ...]] = {}
     inserted = 0
+    field_value = _field_resolver(
+        field_map,
+        (
+            "segment_id",
+            "road_name",
+            "postcode",
+            "usrn",
+            "road_id",
+        ),
+    )
     for row in _iter_validated_raw_rows(
         conn,
         source_name="os_open_roads",
@@ -1628,8 +1811,8 @@ def _populate_stage_open_roads(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        segment_id_raw = _field_value(row, field_map, "segment_id")
-        road_name_raw = _field_value(row, field_map, "road_name")
+        segment_id_raw = field_value(row, "segment_id")
+        road_name_raw = field_value(row, "road_name")
         if segment_id_raw in (None, "") or road_name_raw in (None, ""):
             continue
 
@@ -1637,33 +1820,33 @@ def _populate_stage_open_roads(
         if folded is None:
             continue
 
-        postcode_raw = _field_value(row, field_map, "postcode")
+        postcode_raw = field_value(row, "postcode")
         postcode_n = postcode_norm(str(postcode_raw) if postcode_raw not in (None, "") else None)
 
-        usrn_raw = _field_value(row, field_map, "usrn")
+        usrn_raw = field_value(row, "usrn")
         try:
             usrn = int(usrn_raw) if usrn_raw not in (None, "") else None
         except Exception:
             usrn = None
 
-        road_id_raw = _field_value(row, field_map, "road_id")
+        road_id_raw = field_value(row, "road_id")
 
-        payload.append(
-            (
-                build_run_id,
-                str(segment_id_raw).strip(),
-                str(road_id_raw).strip() if road_id_raw not in (None, "") else None,
-                postcode_n,
-                usrn,
-                str(road_name_raw).strip(),
-                folded,
-                ingest_run_id,
-            )
+        segment_id = str(segment_id_raw).strip()
+        payload[segment_id] = (
+            build_run_id,
+            segment_id,
+            str(road_id_raw).strip() if road_id_raw not in (None, "") else None,
+            postcode_n,
+            usrn,
+            str(road_name_raw).strip(),
+            folded,
+            ingest_run_id,
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
+        inserted += 1
+        if len(payload) >= batch_size:
+            _copy_stage_batch(conn, STAGE_OPEN_ROADS_COPY, payload)
 
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
+    _copy_stage_batch(conn, STAGE_OPEN_ROADS_COPY, payload)
 
     payload_expr = sql.SQL("r.payload_jsonb")
     segment_expr = _json_text_for_field(payload_expr, field_map, "segment_id")
@@ -1830,10 +2013,7 @@ def _populate_stage_open_uprn(
                     SELECT
                         source_row_num,
                         uprn_text::bigint AS uprn,
-                        NULLIF(
-                            upper(regexp_replace(COALESCE(postcode_text, ''), '[^A-Za-z0-9]', '', 'g')),
-                            ''
-                        ) AS postcode_norm
+                        core.postcode_norm(postcode_text) AS postcode_norm
                     FROM extracted
                     WHERE uprn_text IS NOT NULL
                       AND uprn_text <> ''
@@ -1915,7 +2095,7 @@ def _populate_stage_open_lids(
                         (COALESCE(right_id, '') ~ '^[0-9]+$') AS right_is_digits
                     FROM extracted
                 ),
-                resolved AS MATERIALIZED (
+                routed AS (
                     SELECT
                         CASE
                             WHEN relation_hint IN ('toid_usrn', 'toid->usrn', 'toid_usrn_link') THEN 'toid_usrn'
@@ -1944,6 +2124,20 @@ def _populate_stage_open_lids(
                     FROM prepared
                     WHERE left_present AND right_present
                 ),
+                -- Type-check ids once here so the inserts and the relation count
+                -- below do not re-run the digit regex per branch.
+                resolved AS MATERIALIZED (
+                    SELECT
+                        relation_type,
+                        id_1,
+                        id_2
+                    FROM routed
+                    WHERE id_2 ~ '^[0-9]+$'
+                      AND (
+                          relation_type = 'toid_usrn'
+                          OR (relation_type = 'uprn_usrn' AND id_1 ~ '^[0-9]+$')
+                      )
+                ),
                 ins_toid AS (
                     INSERT INTO stage.open_lids_toid_usrn (
                         build_run_id,
@@ -1958,7 +2152,6 @@ def _populate_stage_open_lids(
                         %s
                     FROM resolved
                     WHERE resolved.relation_type = 'toid_usrn'
-                      AND resolved.id_2 ~ '^[0-9]+$'
                     ON CONFLICT (build_run_id, toid, usrn)
                     DO NOTHING
                     RETURNING 1
@@ -1977,8 +2170,6 @@ def _populate_stage_open_lids(
                         %s
                     FROM resolved
                     WHERE resolved.relation_type = 'uprn_usrn'
-                      AND resolved.id_1 ~ '^[0-9]+$'
-                      AND resolved.id_2 ~ '^[0-9]+$'
                     ON CONFLICT (build_run_id, uprn, usrn)
                     DO NOTHING
                     RETURNING 1
@@ -1986,20 +2177,7 @@ def _populate_stage_open_lids(
                 SELECT
                     (SELECT COUNT(*)::bigint FROM ins_toid) AS toid_count,
                     (SELECT COUNT(*)::bigint FROM ins_uprn) AS uprn_count,
-                    (
-                        SELECT COUNT(*)::bigint
-                        FROM resolved
-                        WHERE
-                            (
-                                resolved.relation_type = 'toid_usrn'
-                                AND resolved.id_2 ~ '^[0-9]+$'
-                            )
-                            OR (
-                                resolved.relation_type = 'uprn_usrn'
-                                AND resolved.id_1 ~ '^[0-9]+$'
-                                AND resolved.id_2 ~ '^[0-9]+$'
-                            )
-                    ) AS relation_count
+                    (SELECT COUNT(*)::bigint FROM resolved) AS relation_count
                 """
             ).format(
                 id_1_expr=id_1_expr,
@@ -2058,10 +2236,7 @@ def _populate_stage_nsul(
                 normalized AS (
                     SELECT DISTINCT
                         uprn_text::bigint AS uprn,
-                        NULLIF(
-                            upper(regexp_replace(COALESCE(postcode_text, ''), '[^A-Za-z0-9]', '', 'g')),
-                            ''
-                        ) AS postcode_norm
+                        core.postcode_norm(postcode_text) AS postcode_norm
                     FROM extracted
                     WHERE uprn_text IS NOT NULL
                       AND uprn_text <> ''
@@ -2089,35 +2264,39 @@ def _populate_stage_nsul(
         return int(cur.rowcount)
 
 
-def _populate_stage_osni(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.osni_street_point (
-            build_run_id,
-            feature_id,
-            postcode_norm,
-            street_name_raw,
-            street_name_casefolded,
-            ingest_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s)
+STAGE_OSNI_COPY = StageCopyTarget(
+    table_name="stage.osni_street_point",
+    columns=(
+        "build_run_id",
+        "feature_id",
+        "postcode_norm",
+        "street_name_raw",
+        "street_name_casefolded",
+        "ingest_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, feature_id)
         DO UPDATE SET
             postcode_norm = EXCLUDED.postcode_norm,
             street_name_raw = EXCLUDED.street_name_raw,
             street_name_casefolded = EXCLUDED.street_name_casefolded,
             ingest_run_id = EXCLUDED.ingest_run_id
-        """
-    )
+    """,
+)
+
 
-    payload: list[tuple[Any, ...]] = []
+def _populate_stage_osni(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> int:
+    batch_size = _stage_insert_batch_size("stage.osni_street_point")
+    payload: dict[str, tuple[Any, ...]] = {}
     inserted = 0
     postcode_key = field_map.get("postcode")
+    field_value = _field_resolver(field_map, ("feature_id", "street_name"))
     for row in _iter_validated_raw_rows(
         conn,
         source_name="osni_gazetteer",
@@ -2126,8 +2305,8 @@ def _populate_stage_osni(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        feature_id_raw = _field_value(row, field_map, "feature_id")
-        street_raw = _field_value(row, field_map, "street_name")
+        feature_id_raw = field_value(row, "feature_id")
+        street_raw = field_value(row, "street_name")
         if feature_id_raw in (None, "") or street_raw in (None, ""):
             continue
 
@@ -2135,53 +2314,58 @@ def _populate_stage_osni(
         if folded is None:
             continue
 
-        postcode_n = postcode_norm(str(row.get(postcode_key)) if postcode_key and row.get(postcode_key) not in (None, "") else None)
-        payload.append(
-            (
-                build_run_id,
-                str(feature_id_raw).strip(),
-                postcode_n,
-                str(street_raw).strip(),
-                folded,
-                ingest_run_id,
-            )
+        postcode_raw = row.get(postcode_key) if postcode_key else None
+        postcode_n = postcode_norm(str(postcode_raw) if postcode_raw not in (None, "") else None)
+        feature_id = str(feature_id_raw).strip()
+        payload[feature_id] = (
+            build_run_id,
+            feature_id,
+            postcode_n,
+            str(street_raw).strip(),
+            folded,
+            ingest_run_id,
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
+        inserted += 1
+        if len(payload) >= batch_size:
+            _copy_stage_batch(conn, STAGE_OSNI_COPY, payload)
 
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
+    _copy_stage_batch(conn, STAGE_OSNI_COPY, payload)
     return inserted
 
 
-def _populate_stage_dfi(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.dfi_road_segment (
-            build_run_id,
-            segment_id,
-            postcode_norm,
-            street_name_raw,
-            street_name_casefolded,
-            ingest_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s)
+STAGE_DFI_COPY = StageCopyTarget(
+    table_name="stage.dfi_road_segment",
+    columns=(
+        "build_run_id",
+        "segment_id",
+        "postcode_norm",
+        "street_name_raw",
+        "street_name_casefolded",
+        "ingest_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, segment_id)
         DO UPDATE SET
             postcode_norm = EXCLUDED.postcode_norm,
             street_name_raw = EXCLUDED.street_name_raw,
             street_name_casefolded = EXCLUDED.street_name_casefolded,
             ingest_run_id = EXCLUDED.ingest_run_id
-        """
-    )
+    """,
+)
 
-    payload: list[tuple[Any, ...]] = []
+
+def _populate_stage_dfi(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> int:
+    batch_size = _stage_insert_batch_size("stage.dfi_road_segment")
+    payload: dict[str, tuple[Any, ...]] = {}
     inserted = 0
     postcode_key = field_map.get("postcode")
+    field_value = _field_resolver(field_map, ("segment_id", "street_name"))
     for row in _iter_validated_raw_rows(
         conn,
         source_name="dfi_highway",
@@ -2190,51 +2374,46 @@ def _populate_stage_dfi(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        segment_id_raw = _field_value(row, field_map, "segment_id")
-        street_raw = _field_value(row, field_map, "street_name")
+        segment_id_raw = field_value(row, "segment_id")
+        street_raw = field_value(row, "street_name")
         if segment_id_raw in (None, "") or street_raw in (None, ""):
             continue
 
         folded = street_casefold(str(street_raw))
         if folded is None:
             continue
-        postcode_n = postcode_norm(str(row.get(postcode_key)) if postcode_key and row.get(postcode_key) not in (None, "") else None)
+        postcode_raw = row.get(postcode_key) if postcode_key else None
+        postcode_n = postcode_norm(str(postcode_raw) if postcode_raw not in (None, "") else None)
 
-        payload.append(
-            (
-                build_run_id,
-                str(segment_id_raw).strip(),
-                postcode_n,
-                str(street_raw).strip(),
-                folded,
-                ingest_run_id,
-            )
+        segment_id = str(segment_id_raw).strip()
+        payload[segment_id] = (
+            build_run_id,
+            segment_id,
+            postcode_n,
+            str(street_raw).strip(),
+            folded,
+            ingest_run_id,
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
+        inserted += 1
+        if len(payload) >= batch_size:
+            _copy_stage_batch(conn, STAGE_DFI_COPY, payload)
 
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
+    _copy_stage_batch(conn, STAGE_DFI_COPY, payload)
     return inserted
 
 
-def _populate_stage_ppd(
-    conn: psycopg.Connection,
-    build_run_id: str,
-    ingest_run_id: str,
-    field_map: dict[str, str],
-    required_fields: tuple[str, ...],
-) -> int:
-    insert_sql = sql.SQL(
-        """
-        INSERT INTO stage.ppd_parsed_address (
-            build_run_id,
-            row_hash,
-            postcode_norm,
-            house_number,
-            street_token_raw,
-            street_token_casefolded,
-            ingest_run_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+STAGE_PPD_COPY = StageCopyTarget(
+    table_name="stage.ppd_parsed_address",
+    columns=(
+        "build_run_id",
+        "row_hash",
+        "postcode_norm",
+        "house_number",
+        "street_token_raw",
+        "street_token_casefolded",
+        "ingest_run_id",
+    ),
+    conflict_sql="""
         ON CONFLICT (build_run_id, row_hash)
         DO UPDATE SET
             postcode_norm = EXCLUDED.postcode_norm,
@@ -2242,11 +2421,29 @@ def _populate_stage_ppd(
             street_token_raw = EXCLUDED.street_token_raw,
             street_token_casefolded = EXCLUDED.street_token_casefolded,
             ingest_run_id = EXCLUDED.ingest_run_id
-        """
-    )
+    """,
+)
 
-    payload: list[tuple[Any, ...]] = []
+
+def _populate_stage_ppd(
+    conn: psycopg.Connection,
+    build_run_id: str,
+    ingest_run_id: str,
+    field_map: dict[str, str],
+    required_fields: tuple[str, ...],
+) -> int:
+    batch_size = _stage_insert_batch_size("stage.ppd_parsed_address")
+    payload: dict[str, tuple[Any, ...]] = {}
     inserted = 0
+    field_value = _field_resolver(
+        field_map,
+        (
+            "row_hash",
+            "postcode",
+            "street",
+            "house_number",
+        ),
+    )
     for row in _iter_validated_raw_rows(
         conn,
         source_name="ppd",
@@ -2255,10 +2452,10 @@ def _populate_stage_ppd(
         field_map=field_map,
         required_fields=required_fields,
     ):
-        row_hash_raw = _field_value(row, field_map, "row_hash")
-        postcode_raw = _field_value(row, field_map, "postcode")
-        street_raw = _field_value(row, field_map, "street")
-        house_number_raw = _field_value(row, field_map, "house_number")
+        row_hash_raw = field_value(row, "row_hash")
+        postcode_raw = field_value(row, "postcode")
+        street_raw = field_value(row, "street")
+        house_number_raw = field_value(row, "house_number")
 
         if row_hash_raw in (None, "") or postcode_raw in (None, "") or street_raw in (None, ""):
             continue
@@ -2268,21 +2465,21 @@ def _populate_stage_ppd(
         if postcode_n is None or folded is None:
             continue
 
-        payload.append(
-            (
-                build_run_id,
-                str(row_hash_raw).strip(),
-                postcode_n,
-                str(house_number_raw).strip() if house_number_raw not in (None, "") else None,
-                str(street_raw).strip(),
-                folded,
-                ingest_run_id,
-            )
+        row_hash = str(row_hash_raw).strip()
+        payload[row_hash] = (
+            build_run_id,
+            row_hash,
+            postcode_n,
+            str(house_number_raw).strip() if house_number_raw not in (None, "") else None,
+            str(street_raw).strip(),
+            folded,
+            ingest_run_id,
         )
-        if len(payload) >= STAGE_INSERT_BATCH_SIZE:
-            inserted += _flush_stage_batch(conn, insert_sql, payload)
+        inserted += 1
+        if len(payload) >= batch_size:
+            _copy_stage_batch(conn, STAGE_PPD_COPY, payload)
 
-    inserted += _flush_stage_batch(conn, insert_sql, payload)
+    _copy_stage_batch(conn, STAGE_PPD_COPY, payload)
     return inserted
 
 
@@ -2299,6 +2496,9 @@ def _pass_0b_stage_normalisation(
     _stage_cleanup(conn, build_run_id)
     schema_config = _schema_config()
 
+    # Sources are populated sequentially on the pass connection: the TRUNCATE above
+    # holds ACCESS EXCLUSIVE locks on every stage table until this pass commits, and
+    # the pass checkpoint must cover all stage rows atomically.
     counts: dict[str, int] = {}
 
     if "onspd" in source_runs:
@@ -2396,7 +2596,9 @@ def _pass_0b_stage_normalisation(
 
 
 def _clear_run_outputs(conn: psycopg.Connection, build_run_id: str) -> None:
-    with conn.cursor() as cur:
+    # Other builds' rows share these tables, so TRUNCATE is not an option; pipelining
+    # the per-table deletes costs one round trip instead of one per statement.
+    with conn.pipeline(), conn.cursor() as cur:
         for table in (
             "internal.unit_index",
             "derived.postcode_streets_final_source",
@@ -2409,14 +2611,10 @@ def _clear_run_outputs(conn: psycopg.Connection, build_run_id: str) -> None:
             "core.postcodes",
         ):
             schema_name, table_name = table.split(".", 1)
-            column_name = "produced_build_run_id"
-            if table == "core.postcodes_meta":
-                column_name = "produced_build_run_id"
             cur.execute(
-                sql.SQL("DELETE FROM {}.{} WHERE {} = %s").format(
+                sql.SQL("DELETE FROM {}.{} WHERE produced_build_run_id = %s").format(
                     sql.Identifier(schema_name),
                     sql.Identifier(table_name),
-                    sql.Identifier(column_name),
                 ),
                 (build_run_id,),
             )
@@ -2718,6 +2916,9 @@ def _pass_2_gb_canonical_streets(conn: psycopg.Connection, build_run_id: str) ->
                 ON tmp_toid_name_counts (toid)
             """
         )
+        # Autovacuum never analyzes temp tables; without stats the planner assumes a
+        # tiny relation and picks nested loops for the LIDS join below.
+        cur.execute("ANALYZE tmp_toid_name_counts")
         cur.execute(
             """
             CREATE TEMP TABLE tmp_inferred_name_counts
@@ -2729,7 +2930,7 @@ def _pass_2_gb_canonical_streets(conn: psycopg.Connection, build_run_id: str) ->
                 SUM(n.feature_count)::bigint AS evidence_count,
                 MIN(n.source_priority)::smallint AS source_priority,
                 MIN(n.name_quality_rank)::smallint AS name_quality_rank,
-                (ARRAY_AGG(lids.ingest_run_id ORDER BY lids.ingest_run_id::text ASC))[1] AS usrn_run_id
+                MIN(lids.ingest_run_id::text)::uuid AS usrn_run_id
             FROM tmp_toid_name_counts AS n
             JOIN stage.open_lids_toid_usrn AS lids
               ON lids.build_run_id = %(build_run_id)s
@@ -2751,6 +2952,7 @@ def _pass_2_gb_canonical_streets(conn: psycopg.Connection, build_run_id: str) ->
                 )
             """
         )
+        cur.execute("ANALYZE tmp_inferred_name_counts")
         cur.execute(
             """
             WITH prepared AS (
@@ -2925,7 +3127,7 @@ def _pass_3_open_names_candidates(conn: psycopg.Connection, build_run_id: str) -
             ) AS n
             JOIN core.postcodes AS p
               ON p.produced_build_run_id = %s
-             AND replace(p.postcode, ' ', '') = n.postcode_norm
+             AND p.postcode_norm = n.postcode_norm
             ORDER BY n.resolved_feature_id COLLATE "C" ASC
             """,
             (build_run_id, build_run_id, build_run_id),
@@ -2968,8 +3170,8 @@ def _pass_3_open_names_candidates(conn: psycopg.Connection, build_run_id: str) -
                 """,
                 (build_run_id,),
             )
-            cur.execute("SELECT COUNT(*)::bigint FROM tmp_pass3_promotions")
-            promotions_inserted = int(cur.fetchone()[0])
+            # CREATE TABLE AS reports its row count in the command tag.
+            promotions_inserted = int(cur.rowcount)
 
             if promotions_inserted > 0:
                 cur.execute(
@@ -3141,7 +3343,7 @@ def _pass_5_gb_spatial_fallback(conn: psycopg.Connection, build_run_id: str) ->
             WITH gb_postcodes_without_high AS (
                 SELECT
                     p.postcode,
-                    replace(p.postcode, ' ', '') AS postcode_norm,
+                    p.postcode_norm,
                     p.easting,
                     p.northing
                 FROM core.postcodes AS p
@@ -3317,7 +3519,7 @@ def _pass_5_gb_spatial_fallback(conn: psycopg.Connection, build_run_id: str) ->
             cur.execute(
                 """
                 WITH scored AS (
-                    SELECT
+                    SELECT DISTINCT ON (c.postcode, c.segment_id)
                         c.postcode,
                         c.segment_id,
                         CASE
@@ -3342,28 +3544,17 @@ def _pass_5_gb_spatial_fallback(conn: psycopg.Connection, build_run_id: str) ->
                                  ) THEN 'partial'
                             ELSE 'none'
                         END AS match_type,
-                        p.street_token_raw AS matched_street,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY c.postcode, c.segment_id
-                            ORDER BY
-                                CASE
-                                    WHEN p.street_token_casefolded = c.road_name_casefolded THEN 2::smallint
-                                    WHEN p.street_token_casefolded IS NOT NULL
-                                         AND (
-                                             p.street_token_casefolded LIKE c.road_name_casefolded || ' %%'
-                                             OR c.road_name_casefolded LIKE p.street_token_casefolded || ' %%'
-                                             OR position(c.road_name_casefolded in p.street_token_casefolded) > 0
-                                             OR position(p.street_token_casefolded in c.road_name_casefolded) > 0
-                                         ) THEN 1::smallint
-                                    ELSE 0::smallint
-                                END DESC,
-                                length(COALESCE(p.street_token_casefolded, '')) DESC,
-                                COALESCE(p.street_token_casefolded, '') COLLATE "C" ASC
-                        ) AS rn
+                        p.street_token_raw AS matched_street
                     FROM tmp_pass5_candidates AS c
                     LEFT JOIN tmp_pass5_ppd_tokens AS p
                       ON p.postcode_norm = c.postcode_norm
                     WHERE c.is_spatial
+                    ORDER BY
+                        c.postcode,
+                        c.segment_id,
+                        match_score DESC,
+                        length(COALESCE(p.street_token_casefolded, '')) DESC,
+                        COALESCE(p.street_token_casefolded, '') COLLATE "C" ASC
                 )
                 UPDATE tmp_pass5_candidates AS c
                 SET
@@ -3371,8 +3562,7 @@ def _pass_5_gb_spatial_fallback(conn: psycopg.Connection, build_run_id: str) ->
                     ppd_match_type = s.match_type,
                     ppd_matched_street = CASE WHEN s.match_score > 0 THEN s.matched_street ELSE NULL END
                 FROM scored AS s
-                WHERE s.rn = 1
-                  AND c.postcode = s.postcode
+                WHERE c.postcode = s.postcode
                   AND c.segment_id = s.segment_id
                 """
             )
@@ -3578,7 +3768,7 @@ def _pass_6_ni_candidates(conn: psycopg.Connection, build_run_id: str) -> dict[s
             FROM stage.osni_street_point AS n
             JOIN core.postcodes AS p
               ON p.produced_build_run_id = %s
-             AND replace(p.postcode, ' ', '') = n.postcode_norm
+             AND p.postcode_norm = n.postcode_norm
             WHERE n.build_run_id = %s
               AND p.subdivision_code = 'GB-NIR'
             ORDER BY n.feature_id COLLATE "C" ASC
@@ -3590,7 +3780,7 @@ def _pass_6_ni_candidates(conn: psycopg.Connection, build_run_id: str) -> dict[s
         cur.execute(
             """
             WITH ni_without_candidates AS (
-                SELECT p.postcode, replace(p.postcode, ' ', '') AS postcode_norm
+                SELECT p.postcode, p.postcode_norm
                 FROM core.postcodes AS p
                 WHERE p.produced_build_run_id = %s
                   AND p.subdivision_code = 'GB-NIR'
@@ -3602,20 +3792,17 @@ def _pass_6_ni_candidates(conn: psycopg.Connection, build_run_id: str) -> dict[s
                   )
             ),
             ranked_segments AS (
-                SELECT
+                SELECT DISTINCT ON (n.postcode)
                     n.postcode,
                     d.segment_id,
                     d.street_name_raw,
                     d.street_name_casefolded,
-                    d.ingest_run_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY n.postcode
-                        ORDER BY d.segment_id COLLATE "C" ASC
-                    ) AS rn
+                    d.ingest_run_id
                 FROM ni_without_candidates AS n
                 JOIN stage.dfi_road_segment AS d
                   ON d.build_run_id = %s
                  AND d.postcode_norm = n.postcode_norm
+                ORDER BY n.postcode, d.segment_id COLLATE "C" ASC
             )
             INSERT INTO derived.postcode_street_candidates (
                 produced_build_run_id,
@@ -3643,7 +3830,6 @@ def _pass_6_ni_candidates(conn: psycopg.Connection, build_run_id: str) -> dict[s
                 r.ingest_run_id,
                 jsonb_build_object('segment_id', r.segment_id)
             FROM ranked_segments AS r
-            WHERE r.rn = 1
             ORDER BY r.postcode COLLATE "C" ASC
             """,
             (build_run_id, build_run_id, build_run_id),
@@ -3658,26 +3844,34 @@ def _pass_6_ni_candidates(conn: psycopg.Connection, build_run_id: str) -> dict[s
 
 def _pass_7_ppd_gap_fill(conn: psycopg.Connection, build_run_id: str) -> dict[str, int]:
     with conn.cursor() as cur:
+        # Both outputs derive from the same PPD/postcode/street join; materialise it
+        # once rather than re-running the join over the full PPD stage per insert.
+        cur.execute(
+            """
+            CREATE TEMP TABLE tmp_ppd_matched
+            ON COMMIT DROP AS
+            SELECT
+                c.postcode,
+                p.house_number,
+                p.street_token_raw,
+                p.ingest_run_id,
+                s.usrn,
+                s.street_name,
+                s.street_name_casefolded
+            FROM stage.ppd_parsed_address AS p
+            JOIN core.postcodes AS c
+              ON c.produced_build_run_id = %s
+             AND c.postcode_norm = p.postcode_norm
+            LEFT JOIN core.streets_usrn AS s
+              ON s.produced_build_run_id = %s
+             AND s.street_name_casefolded = p.street_token_casefolded
+            WHERE p.build_run_id = %s
+            """,
+            (build_run_id, build_run_id, build_run_id),
+        )
+
         cur.execute(
             """
-            WITH matched AS (
-                SELECT
-                    c.postcode,
-                    p.house_number,
-                    p.street_token_raw,
-                    p.ingest_run_id,
-                    s.usrn,
-                    s.street_name,
-                    s.street_name_casefolded
-                FROM stage.ppd_parsed_address AS p
-                JOIN core.postcodes AS c
-                  ON c.produced_build_run_id = %s
-                 AND replace(c.postcode, ' ', '') = p.postcode_norm
-                LEFT JOIN core.streets_usrn AS s
-                  ON s.produced_build_run_id = %s
-                 AND s.street_name_casefolded = p.street_token_casefolded
-                WHERE p.build_run_id = %s
-            )
             INSERT INTO derived.postcode_street_candidates (
                 produced_build_run_id,
                 postcode,
@@ -3703,33 +3897,17 @@ def _pass_7_ppd_gap_fill(conn: psycopg.Connection, build_run_id: str) -> dict[st
                 'ppd',
                 m.ingest_run_id,
                 jsonb_build_object('house_number', m.house_number)
-            FROM matched AS m
+            FROM tmp_ppd_matched AS m
             ORDER BY m.postcode COLLATE "C" ASC
             """,
-            (build_run_id, build_run_id, build_run_id, build_run_id),
+            (build_run_id,),
         )
         candidate_inserted = cur.rowcount
 
+        # unit_index rows are only looked up by (postcode, house_number); nothing reads
+        # index_id, so the insert skips the sort over every matched PPD row.
         cur.execute(
             """
-            WITH matched AS (
-                SELECT
-                    c.postcode,
-                    p.house_number,
-                    p.ingest_run_id,
-                    s.usrn,
-                    COALESCE(s.street_name, p.street_token_raw) AS street_name,
-                    CASE WHEN s.usrn IS NULL THEN 'low' ELSE 'medium' END AS confidence,
-                    CASE WHEN s.usrn IS NULL THEN 'ppd_parse_unmatched' ELSE 'ppd_parse_matched' END AS source_type
-                FROM stage.ppd_parsed_address AS p
-                JOIN core.postcodes AS c
-                  ON c.produced_build_run_id = %s
-                 AND replace(c.postcode, ' ', '') = p.postcode_norm
-                LEFT JOIN core.streets_usrn AS s
-                  ON s.produced_build_run_id = %s
-                 AND s.street_name_casefolded = p.street_token_casefolded
-                WHERE p.build_run_id = %s
-            )
             INSERT INTO internal.unit_index (
                 produced_build_run_id,
                 postcode,
@@ -3742,17 +3920,16 @@ def _pass_7_ppd_gap_fill(conn: psycopg.Connection, build_run_id: str) -> dict[st
             )
             SELECT
                 %s,
-                postcode,
-                COALESCE(house_number, ''),
-                street_name,
-                usrn,
-                confidence,
-                source_type,
-                ingest_run_id
-            FROM matched
-            ORDER BY postcode COLLATE "C" ASC
+                m.postcode,
+                COALESCE(m.house_number, ''),
+                COALESCE(m.street_name, m.street_token_raw),
+                m.usrn,
+                CASE WHEN m.usrn IS NULL THEN 'low' ELSE 'medium' END,
+                CASE WHEN m.usrn IS NULL THEN 'ppd_parse_unmatched' ELSE 'ppd_parse_matched' END,
+                m.ingest_run_id
+            FROM tmp_ppd_matched AS m
             """,
-            (build_run_id, build_run_id, build_run_id, build_run_id),
+            (build_run_id,),
         )
         unit_index_inserted = cur.rowcount
 
@@ -3775,10 +3952,9 @@ def _pass_8_finalisation(conn: psycopg.Connection, build_run_id: str, dataset_ve
             ) ON COMMIT DROP
             """
         )
-        cur.executemany(
-            "INSERT INTO tmp_candidate_weights (candidate_type, weight) VALUES (%s, %s)",
-            [(candidate_type, weight) for candidate_type, weight in weight_map.items()],
-        )
+        with cur.copy("COPY tmp_candidate_weights (candidate_type, weight) FROM STDIN") as copy:
+            for candidate_type, weight in weight_map.items():
+                copy.write_row((candidate_type, weight))
 
         cur.execute("DROP TABLE IF EXISTS pg_temp.tmp_weighted_candidates")
         cur.execute(
@@ -3810,24 +3986,6 @@ def _pass_8_finalisation(conn: psycopg.Connection, build_run_id: str, dataset_ve
             (build_run_id,),
         )
 
-        cur.execute(
-            """
-            SELECT postcode
-            FROM (
-                SELECT postcode, SUM(weight) AS total_weight
-                FROM tmp_weighted_candidates
-                GROUP BY postcode
-            ) AS totals
-            WHERE total_weight <= 0
-            LIMIT 1
-            """
-        )
-        bad = cur.fetchone()
-        if bad is not None:
-            raise BuildError(
-                f"Finalisation failed: total_weight <= 0 for postcode={bad[0]}"
-            )
-
         cur.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_tmp_weighted_candidates_street
@@ -3846,27 +4004,71 @@ def _pass_8_finalisation(conn: psycopg.Connection, build_run_id: str, dataset_ve
                 )
             """
         )
+        # Temp tables are never parallel scanned and autovacuum skips them, so
+        # explicit stats are what the grouping and lineage joins can use.
+        cur.execute("ANALYZE tmp_weighted_candidates")
+
+        # The per-street and per-postcode aggregates are materialised and
+        # analysed so the scoring join and window run against real statistics
+        # rather than re-planning inline CTEs over tmp_weighted_candidates.
+        cur.execute("DROP TABLE IF EXISTS pg_temp.tmp_final_grouped")
+        cur.execute(
+            """
+            CREATE TEMP TABLE tmp_final_grouped AS
+            SELECT
+                postcode,
+                canonical_street_name,
+                MIN(usrn) AS usrn,
+                SUM(weight) AS weighted_score,
+                MAX(conf_rank) AS conf_rank
+            FROM tmp_weighted_candidates
+            GROUP BY postcode, canonical_street_name
+            """
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_tmp_final_grouped_postcode
+                ON tmp_final_grouped (postcode)
+            """
+        )
+        cur.execute("ANALYZE tmp_final_grouped")
+
+        cur.execute("DROP TABLE IF EXISTS pg_temp.tmp_final_totals")
+        cur.execute(
+            """
+            CREATE TEMP TABLE tmp_final_totals AS
+            SELECT postcode, SUM(weighted_score) AS total_weight
+            FROM tmp_final_grouped
+            GROUP BY postcode
+            """
+        )
+        cur.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_tmp_final_totals_postcode
+                ON tmp_final_totals (postcode)
+            """
+        )
+        cur.execute("ANALYZE tmp_final_totals")
+
+        cur.execute(
+            """
+            SELECT postcode
+            FROM tmp_final_totals
+            WHERE total_weight <= 0
+            LIMIT 1
+            """
+        )
+        bad = cur.fetchone()
+        if bad is not None:
+            raise BuildError(
+                f"Finalisation failed: total_weight <= 0 for postcode={bad[0]}"
+            )
 
         cur.execute("DROP TABLE IF EXISTS pg_temp.tmp_final_scored")
         cur.execute(
             """
             CREATE TEMP TABLE tmp_final_scored AS
-            WITH grouped AS (
-                SELECT
-                    postcode,
-                    canonical_street_name,
-                    MIN(usrn) AS usrn,
-                    SUM(weight) AS weighted_score,
-                    MAX(conf_rank) AS conf_rank
-                FROM tmp_weighted_candidates
-                GROUP BY postcode, canonical_street_name
-            ),
-            totals AS (
-                SELECT postcode, SUM(weighted_score) AS total_weight
-                FROM grouped
-                GROUP BY postcode
-            ),
-            scored AS (
+            WITH scored AS (
                 SELECT
                     g.postcode,
                     g.canonical_street_name,
@@ -3874,8 +4076,8 @@ def _pass_8_finalisation(conn: psycopg.Connection, build_run_id: str, dataset_ve
                     g.weighted_score,
                     g.conf_rank,
                     (g.weighted_score / t.total_weight) AS raw_probability
-                FROM grouped AS g
-                JOIN totals AS t
+                FROM tmp_final_grouped AS g
+                JOIN tmp_final_totals AS t
                   ON t.postcode = g.postcode
             ),
             rounded AS (
@@ -4027,27 +4229,21 @@ def _pass_8_finalisation(conn: psycopg.Connection, build_run_id: str, dataset_ve
         )
         inserted_final_source = int(cur.rowcount)
 
+        # One pass over core.postcodes that only rewrites rows whose flag changes,
+        # instead of resetting every row and then updating each postcode again.
         cur.execute(
             """
-            UPDATE core.postcodes
-            SET multi_street = false
-            WHERE produced_build_run_id = %s
-            """,
-            (build_run_id,),
-        )
-        cur.execute(
-            """
-            WITH counts AS (
-                SELECT postcode, COUNT(*) AS street_count
+            WITH multi AS (
+                SELECT postcode
                 FROM derived.postcode_streets_final
                 WHERE produced_build_run_id = %s
                 GROUP BY postcode
+                HAVING COUNT(*) > 1
             )
             UPDATE core.postcodes AS p
-            SET multi_street = (c.street_count > 1)
-            FROM counts AS c
+            SET multi_street = (p.postcode IN (SELECT postcode FROM multi))
             WHERE p.produced_build_run_id = %s
-              AND p.postcode = c.postcode
+              AND p.multi_street IS DISTINCT FROM (p.postcode IN (SELECT postcode FROM multi))
             """,
             (build_run_id, build_run_id),
         )
@@ -4100,6 +4296,7 @@ def _create_api_projection_tables(
             ).format(street_ident),
             (dataset_version, build_run_id),
         )
+        street_count = int(cur.rowcount)
 
         cur.execute(sql.SQL("DROP TABLE IF EXISTS api.{} CASCADE").format(lookup_ident))
         cur.execute(
@@ -4118,16 +4315,12 @@ def _create_api_projection_tables(
                             )
                             ORDER BY
                                 s.probability DESC,
-                                CASE s.confidence
-                                    WHEN 'high' THEN 3
-                                    WHEN 'medium' THEN 2
-                                    WHEN 'low' THEN 1
-                                    ELSE 0
-                                END DESC,
+                                s.confidence_rank DESC,
                                 s.street_name COLLATE "C" ASC,
                                 s.usrn ASC NULLS LAST
                         ) AS streets_json
-                    FROM api.{} AS s
+                    FROM derived.postcode_streets_final AS s
+                    WHERE s.produced_build_run_id = %s
                     GROUP BY s.postcode
                 ),
                 source_rows AS (
@@ -4180,14 +4373,10 @@ def _create_api_projection_tables(
                 WHERE p.produced_build_run_id = %s
                 ORDER BY p.postcode COLLATE "C" ASC
                 """
-            ).format(lookup_ident, street_ident),
-            (build_run_id, dataset_version, build_run_id),
+            ).format(lookup_ident),
+            (build_run_id, build_run_id, dataset_version, build_run_id),
         )
-
-        cur.execute(sql.SQL("SELECT COUNT(*) FROM api.{}").format(street_ident))
-        street_count = int(cur.fetchone()[0])
-        cur.execute(sql.SQL("SELECT COUNT(*) FROM api.{}").format(lookup_ident))
-        lookup_count = int(cur.fetchone()[0])
+        lookup_count = int(cur.rowcount)
 
     return {
         f"api.{street_table_name}": street_count,
@@ -4195,22 +4384,24 @@ def _create_api_projection_tables(
     }
 
 
+PASS_HANDLERS = {
+    "0a_raw_ingest": _pass_0a_raw_ingest,
+    "0b_stage_normalisation": _pass_0b_stage_normalisation,
+    "1_onspd_backbone": _pass_1_onspd_backbone,
+    "2_gb_canonical_streets": _pass_2_gb_canonical_streets,
+    "3_open_names_candidates": _pass_3_open_names_candidates,
+    "4_uprn_reinforcement": _pass_4_uprn_reinforcement,
+    "5_gb_spatial_fallback": _pass_5_gb_spatial_fallback,
+    "6_ni_candidates": _pass_6_ni_candidates,
+    "7_ppd_gap_fill": _pass_7_ppd_gap_fill,
+    "8_finalisation": _pass_8_finalisation,
+}
+
+
 def _pass_handler(
     pass_name: str,
 ):
-    handlers = {
-        "0a_raw_ingest": _pass_0a_raw_ingest,
-        "0b_stage_normalisation": _pass_0b_stage_normalisation,
-        "1_onspd_backbone": _pass_1_onspd_backbone,
-        "2_gb_canonical_streets": _pass_2_gb_canonical_streets,
-        "3_open_names_candidates": _pass_3_open_names_candidates,
-        "4_uprn_reinforcement": _pass_4_uprn_reinforcement,
-        "5_gb_spatial_fallback": _pass_5_gb_spatial_fallback,
-        "6_ni_candidates": _pass_6_ni_candidates,
-        "7_ppd_gap_fill": _pass_7_ppd_gap_fill,
-        "8_finalisation": _pass_8_finalisation,
-    }
-    return handlers[pass_name]
+    return PASS_HANDLERS[pass_name]
 
 
 def run_build(
@@ -4279,11 +4470,14 @@ def run_build(
             else:
                 row_count_summary = handler(conn, build_run_id)
 
-            _mark_pass_checkpoint(conn, build_run_id, pass_name, row_count_summary)
-            conn.commit()
+            # Pipeline mode sends the checkpoint write and COMMIT in one network flush.
+            with conn.pipeline():
+                _mark_pass_checkpoint(conn, build_run_id, pass_name, row_count_summary)
+                conn.commit()
 
-        _mark_build_built(conn, bundle_id, build_run_id)
-        conn.commit()
+        with conn.pipeline():
+            _mark_build_built(conn, bundle_id, build_run_id)
+            conn.commit()
         return BuildRunResult(
             build_run_id=build_run_id,
             status="built",
@@ -4300,6 +4494,45 @@ def run_build(
         raise
 
 
+# Verify streams every final and API row through the hash; the psycopg default of
+# 100 rows per FETCH makes it round-trip bound on large builds.
+CANONICAL_HASH_FETCH_BATCH_SIZE = _env_positive_int("PIPELINE_CANONICAL_HASH_FETCH_BATCH_SIZE", 50000)
+# Cursor names only need to be unique among the connection's open cursors.
+_CANONICAL_CURSOR_IDS = itertools.count(1)
+
+
+def _canonical_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _canonical_fallback(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=True, default=str)
+
+
+# Per-type encoders producing exactly what json.dumps(..., ensure_ascii=True,
+# default=str) emits for each value, with Decimals hashed as their string form.
+# Dispatch is on the exact type, so subclasses fall back to json.dumps.
+_CANONICAL_VALUE_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: json.encoder.encode_basestring_ascii,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+    float: _canonical_float,
+    Decimal: lambda value: json.encoder.encode_basestring_ascii(str(value)),
+}
+
+
+def _canonical_row_json(row: tuple[Any, ...]) -> str:
+    encoders = _CANONICAL_VALUE_ENCODERS
+    return "[" + ",".join(encoders.get(type(value), _canonical_fallback)(value) for value in row) + "]"
+
+
 def _canonical_hash_query(
     conn: psycopg.Connection,
     query_sql: sql.SQL,
@@ -4308,21 +4541,19 @@ def _canonical_hash_query(
     digest = hashlib.sha256()
     row_count = 0
 
-    cursor_name = f"canon_{uuid.uuid4().hex[:12]}"
-    with conn.cursor(name=cursor_name) as cur:
+    cursor_name = f"canon_{next(_CANONICAL_CURSOR_IDS)}"
+    with conn.cursor(name=cursor_name, scrollable=False) as cur:
         cur.execute(query_sql, params)
-        for row in cur:
-            row_count += 1
-            normalized = []
-            for value in row:
-                if isinstance(value, Decimal):
-                    normalized.append(str(value))
-                else:
-                    normalized.append(value)
-            digest.update(
-                json.dumps(normalized, separators=(",", ":"), ensure_ascii=True, default=str).encode("utf-8")
-            )
-            digest.update(b"\n")
+        while True:
+            rows = cur.fetchmany(CANONICAL_HASH_FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            row_count += len(rows)
+            lines = [_canonical_row_json(row) for row in rows]
+            # One update per page hashes the same newline-terminated bytes as
+            # per-row updates, with far fewer calls into the digest.
+            lines.append("")
+            digest.update("\n".join(lines).encode("utf-8"))
 
     return row_count, digest.hexdigest()
 
@@ -4344,7 +4575,6 @@ def verify_build(conn: psycopg.Connection, build_run_id: str) -> VerifyResult:
         if status not in {"built", "published"}:
             raise BuildError(f"Build run {build_run_id} must be built before verify (status={status})")
 
-    with conn.cursor() as cur:
         cur.execute(
             """
             SELECT postcode, SUM(probability)::numeric(10,4) AS prob_sum
@@ -4424,32 +4654,36 @@ def verify_build(conn: psycopg.Connection, build_run_id: str) -> VerifyResult:
                 f"API projection tables not found for dataset_version={dataset_version}; expected {street_table} and {lookup_table}"
             )
 
-    with conn.cursor() as cur:
         cur.execute("DELETE FROM meta.canonical_hash WHERE build_run_id = %s", (build_run_id,))
 
+    hash_rows = []
     for object_name, query_sql, params in specs:
         row_count, sha256_digest = _canonical_hash_query(conn, query_sql, params)
         object_hashes[object_name] = sha256_digest
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO meta.canonical_hash (
-                    build_run_id,
-                    object_name,
-                    projection,
-                    row_count,
-                    sha256,
-                    computed_at_utc
-                ) VALUES (%s, %s, %s, %s, %s, now())
-                """,
-                (
-                    build_run_id,
-                    object_name,
-                    Jsonb({"ordering": "deterministic"}),
-                    row_count,
-                    sha256_digest,
-                ),
+        hash_rows.append(
+            (
+                build_run_id,
+                object_name,
+                Jsonb({"ordering": "deterministic"}),
+                row_count,
+                sha256_digest,
             )
+        )
+
+    with conn.cursor() as cur:
+        cur.executemany(
+            """
+            INSERT INTO meta.canonical_hash (
+                build_run_id,
+                object_name,
+                projection,
+                row_count,
+                sha256,
+                computed_at_utc
+            ) VALUES (%s, %s, %s, %s, %s, now())
+            """,
+            hash_rows,
+        )
 
     return VerifyResult(build_run_id=build_run_id, status="verified", object_hashes=object_hashes)
 
@@ -4488,7 +4722,9 @@ def publish_build(conn: psycopg.Connection, build_run_id: str, actor: str) -> Pu
                 f"{dataset_version}"
             )
 
-    with conn.cursor() as cur:
+    # Nothing below reads a result back, so the view swap and metadata writes
+    # go to the server in one pipelined batch.
+    with conn.pipeline(), conn.cursor() as cur:
         cur.execute(
             sql.SQL("CREATE OR REPLACE VIEW api.postcode_lookup AS SELECT * FROM api.{}").format(
                 sql.Identifier(lookup_table_name)
@@ -4500,9 +4736,6 @@ def publish_build(conn: psycopg.Connection, build_run_id: str, actor: str) -> Pu
             ).format(sql.Identifier(street_lookup_table_name))
         )
 
-        cur.execute("SELECT txid_current()")
-        publish_txid = int(cur.fetchone()[0])
-
         cur.execute(
             """
             INSERT INTO meta.dataset_publication (
@@ -4513,7 +4746,7 @@ def publish_build(conn: psycopg.Connection, build_run_id: str, actor: str) -> Pu
                 lookup_table_name,
                 street_lookup_table_name,
                 publish_txid
-            ) VALUES (%s, %s, now(), %s, %s, %s, %s)
+            ) VALUES (%s, %s, now(), %s, %s, %s, txid_current())
             ON CONFLICT (dataset_version)
             DO UPDATE SET
                 build_run_id = EXCLUDED.build_run_id,
@@ -4529,7 +4762,6 @@ def publish_build(conn: psycopg.Connection, build_run_id: str, actor: str) -> Pu
                 actor,
                 f"api.{lookup_table_name}",
                 f"api.{street_lookup_table_name}",
-                publish_txid,
             ),
         )
 
@@ -94,6 +94,18 @@ class BuildBundleManifest:
     source_runs: dict[str, tuple[str, ...]]
     raw: dict[str, Any]
 
+    def __post_init__(self) -> None:
+        # Canonical order (sorted sources, sorted run ids) so bundle hashing can
+        # serialise source_runs as-is.
+        object.__setattr__(
+            self,
+            "source_runs",
+            {
+                source_name: tuple(sorted(self.source_runs[source_name]))
+                for source_name in sorted(self.source_runs)
+            },
+        )
+
 
 def _load_json(path: Path) -> dict[str, Any]:
     try:
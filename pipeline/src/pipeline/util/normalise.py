@@ -10,6 +10,9 @@ from pathlib import Path
 
 from pipeline.config import normalisation_config_path
 
+POSTCODE_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]")
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+
 
 def _load_json_config(path: Path) -> dict[str, object]:
     return json.loads(path.read_text(encoding="utf-8"))
@@ -37,15 +40,18 @@ def _strip_punctuation() -> str:
     return value
 
 
+# PPD and Open Names repeat the same postcodes many times per pass.
+@lru_cache(maxsize=262_144)
 def postcode_norm(value: str | None) -> str | None:
     if value is None:
         return None
-    cleaned = re.sub(r"[^A-Za-z0-9]", "", value).upper()
+    cleaned = POSTCODE_UNSAFE_RE.sub("", value).upper()
     if not cleaned:
         return None
     return cleaned
 
 
+@lru_cache(maxsize=262_144)
 def postcode_display(value: str | None) -> str | None:
     normalized = postcode_norm(value)
     if normalized is None:
@@ -55,16 +61,19 @@ def postcode_display(value: str | None) -> str | None:
     return f"{normalized[:-3]} {normalized[-3:]}"
 
 
+# Street names repeat heavily across PPD, Open Names and road rows; the
+# transform is pure, so stage loops can reuse earlier results.
+@lru_cache(maxsize=500_000)
 def street_casefold(value: str | None) -> str | None:
     if value is None:
         return None
 
     text = unicodedata.normalize("NFKC", value).strip().upper()
-    text = re.sub(r"\s+", " ", text)
+    text = WHITESPACE_RUN_RE.sub(" ", text)
     strip_chars = _strip_punctuation()
     if strip_chars:
         text = text.translate(str.maketrans("", "", strip_chars))
-    text = re.sub(r"\s+", " ", text).strip()
+    text = WHITESPACE_RUN_RE.sub(" ", text).strip()
     if not text:
         return None
 
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import sys
+import unittest
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "pipeline" / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+WORKFLOWS = SRC / "pipeline" / "build" / "workflows.py"
+
+from pipeline.build import workflows  # noqa: E402
+
+
+ROWS = [
+    ("AB1 0AA", "HIGH STREET", 12345, "high", Decimal("2.5000"), Decimal("0.7500"), True),
+    ("AB1 0AA", "CAFÉ ROAD", None, "low", Decimal("1.0000"), Decimal("0.2500"), False),
+    ("BT1 1AA", "Quote \"Lane\"", 7, "medium", Decimal("1.0000"), Decimal("1.0000"), None),
+]
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[tuple]) -> None:
+        self._rows = list(rows)
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, query: object, params: object = None) -> None:
+        return None
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class _FakeConnection:
+    def __init__(self, rows: list[tuple]) -> None:
+        self._rows = rows
+
+    def cursor(self, *args: object, **kwargs: object) -> _FakeCursor:
+        return _FakeCursor(self._rows)
+
+
+def _per_row_reference(rows: list[tuple]) -> str:
+    digest = hashlib.sha256()
+    for row in rows:
+        normalized = [str(value) if isinstance(value, Decimal) else value for value in row]
+        digest.update(
+            json.dumps(normalized, separators=(",", ":"), ensure_ascii=True, default=str).encode("utf-8")
+        )
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class CanonicalHashContractTests(unittest.TestCase):
+    def test_canonical_hash_fetches_large_forward_only_pages(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn(
+            '_env_positive_int("PIPELINE_CANONICAL_HASH_FETCH_BATCH_SIZE", 50000)',
+            text,
+        )
+        self.assertIn("conn.cursor(name=cursor_name, scrollable=False)", text)
+        self.assertIn("cur.fetchmany(CANONICAL_HASH_FETCH_BATCH_SIZE)", text)
+
+    def test_paged_hash_matches_per_row_digest(self) -> None:
+        expected = _per_row_reference(ROWS)
+        for page_size in (1, 2, 50000):
+            with mock.patch.object(workflows, "CANONICAL_HASH_FETCH_BATCH_SIZE", page_size):
+                row_count, digest = workflows._canonical_hash_query(_FakeConnection(ROWS), "SELECT 1")
+            self.assertEqual(row_count, len(ROWS))
+            self.assertEqual(digest, expected)
+
+    def test_row_encoder_matches_json_dumps(self) -> None:
+        samples = [
+            *ROWS,
+            ("tab\tnewline\n", "ŁÓDŹ \U0001f600", -0, 2**70, Decimal("-0.0001"), Decimal("1E+3")),
+            (51.5074, -0.1278, 1e-7, float("nan"), float("inf"), float("-inf")),
+            (uuid.UUID("12345678-1234-5678-1234-567812345678"), None, True, ""),
+            (),
+        ]
+        for row in samples:
+            normalized = [str(value) if isinstance(value, Decimal) else value for value in row]
+            expected = json.dumps(normalized, separators=(",", ":"), ensure_ascii=True, default=str)
+            self.assertEqual(workflows._canonical_row_json(row), expected)
+
+    def test_empty_result_hashes_to_empty_digest(self) -> None:
+        row_count, digest = workflows._canonical_hash_query(_FakeConnection([]), "SELECT 1")
+        self.assertEqual(row_count, 0)
+        self.assertEqual(digest, hashlib.sha256().hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
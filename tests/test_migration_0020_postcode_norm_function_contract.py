@@ -0,0 +1,30 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0020_v3_postcode_norm_function.sql"
+)
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class Migration0020PostcodeNormFunctionContractTests(unittest.TestCase):
+    def test_migration_defines_immutable_postcode_norm(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("CREATE OR REPLACE FUNCTION core.postcode_norm(value text)", text)
+        self.assertIn("IMMUTABLE", text)
+        self.assertIn("regexp_replace(COALESCE(value, ''), '[^A-Za-z0-9]', '', 'g')", text)
+
+    def test_sql_stage_loaders_use_postcode_norm_function(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertEqual(text.count("core.postcode_norm("), 3)
+        self.assertNotIn("'[^A-Za-z0-9]', '', 'g'", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
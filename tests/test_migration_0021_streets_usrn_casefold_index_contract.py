@@ -0,0 +1,24 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0021_v3_streets_usrn_casefold_index.sql"
+)
+
+
+class Migration0021StreetsUsrnCasefoldIndexContractTests(unittest.TestCase):
+    def test_migration_indexes_casefolded_street_lookup(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("CREATE INDEX IF NOT EXISTS idx_core_streets_usrn_run_casefolded", text)
+        self.assertIn("ON core.streets_usrn (produced_build_run_id, street_name_casefolded)", text)
+        self.assertIn("INCLUDE (usrn, street_name)", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
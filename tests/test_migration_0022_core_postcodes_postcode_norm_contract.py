@@ -0,0 +1,30 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0022_v3_core_postcodes_postcode_norm.sql"
+)
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class Migration0022CorePostcodesPostcodeNormContractTests(unittest.TestCase):
+    def test_migration_adds_indexed_generated_postcode_norm(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("GENERATED ALWAYS AS (replace(postcode, ' ', '')) STORED", text)
+        self.assertIn("ON core.postcodes (produced_build_run_id, postcode_norm)", text)
+
+    def test_passes_join_on_stored_postcode_norm(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertNotIn("replace(p.postcode, ' ', '')", text)
+        self.assertNotIn("replace(c.postcode, ' ', '')", text)
+        self.assertIn("AND p.postcode_norm = n.postcode_norm", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
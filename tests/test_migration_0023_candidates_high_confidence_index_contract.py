@@ -0,0 +1,24 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0023_v3_candidates_high_confidence_index.sql"
+)
+
+
+class Migration0023CandidatesHighConfidenceIndexContractTests(unittest.TestCase):
+    def test_migration_adds_partial_high_confidence_index(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("CREATE INDEX IF NOT EXISTS idx_candidate_run_postcode_high", text)
+        self.assertIn("ON derived.postcode_street_candidates (produced_build_run_id, postcode)", text)
+        self.assertIn("WHERE confidence = 'high';", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
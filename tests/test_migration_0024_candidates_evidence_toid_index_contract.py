@@ -0,0 +1,27 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0024_v3_candidates_evidence_toid_index.sql"
+)
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class Migration0024CandidatesEvidenceToidIndexContractTests(unittest.TestCase):
+    def test_index_matches_pass3_promotion_predicate(self) -> None:
+        migration = MIGRATION.read_text(encoding="utf-8")
+        workflows = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn("(produced_build_run_id, (evidence_json ->> 'toid'))", migration)
+        self.assertIn("WHERE candidate_type = 'names_postcode_feature'", migration)
+        self.assertIn("AND parent.candidate_type = 'names_postcode_feature'", workflows)
+        self.assertIn("AND parent.evidence_json ->> 'toid' IS NOT NULL", workflows)
+
+
+if __name__ == "__main__":
+    unittest.main()
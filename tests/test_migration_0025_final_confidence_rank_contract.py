@@ -0,0 +1,30 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0025_v3_final_confidence_rank.sql"
+)
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class Migration0025FinalConfidenceRankContractTests(unittest.TestCase):
+    def test_migration_adds_generated_rank_and_projection_index(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("ADD COLUMN IF NOT EXISTS confidence_rank smallint", text)
+        self.assertIn("CREATE INDEX IF NOT EXISTS idx_final_run_postcode_projection", text)
+        self.assertIn("confidence_rank DESC", text)
+
+    def test_lookup_projection_orders_streets_by_stored_rank(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn("s.confidence_rank DESC,", text)
+        self.assertIn("FROM derived.postcode_streets_final AS s", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
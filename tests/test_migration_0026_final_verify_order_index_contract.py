@@ -0,0 +1,31 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MIGRATION = (
+    ROOT
+    / "pipeline"
+    / "sql"
+    / "migrations"
+    / "0026_v3_final_verify_order_index.sql"
+)
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class Migration0026FinalVerifyOrderIndexContractTests(unittest.TestCase):
+    def test_migration_indexes_final_rows_in_verify_order(self) -> None:
+        text = MIGRATION.read_text(encoding="utf-8")
+        self.assertIn("CREATE INDEX IF NOT EXISTS idx_final_run_postcode_street_c", text)
+        self.assertIn('postcode COLLATE "C",\n        street_name COLLATE "C",\n        usrn', text)
+
+    def test_verify_orders_final_rows_by_indexed_keys(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn(
+            'ORDER BY postcode COLLATE "C" ASC, street_name COLLATE "C" ASC, usrn ASC NULLS LAST',
+            text,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
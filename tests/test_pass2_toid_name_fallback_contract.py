@@ -23,6 +23,11 @@ class Pass2ToidNameFallbackContractTests(unittest.TestCase):
         self.assertIn("name_quality_rank ASC", text)
         self.assertIn("source_priority ASC", text)
 
+    def test_pass2_analyzes_materialised_temp_tables(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn('cur.execute("ANALYZE tmp_toid_name_counts")', text)
+        self.assertIn('cur.execute("ANALYZE tmp_inferred_name_counts")', text)
+
 
 if __name__ == "__main__":
     unittest.main()
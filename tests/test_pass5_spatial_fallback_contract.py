@@ -33,6 +33,11 @@ class Pass5SpatialFallbackContractTests(unittest.TestCase):
         self.assertIn('"pass5_ppd_match_partial_count"', text)
         self.assertIn('"pass5_ppd_match_none_count"', text)
 
+    def test_pass5_ppd_scoring_keeps_first_row_per_segment_with_distinct_on(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn("SELECT DISTINCT ON (c.postcode, c.segment_id)", text)
+        self.assertNotIn("WHERE s.rn = 1", text)
+
 
 if __name__ == "__main__":
     unittest.main()
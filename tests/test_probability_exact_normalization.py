@@ -16,6 +16,14 @@ class ProbabilityExactNormalizationTests(unittest.TestCase):
         self.assertIn("WHEN rn = 1", text)
         self.assertIn("(1.0000 - rounded_sum)", text)
 
+    def test_scoring_reads_materialised_aggregates(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn("CREATE TEMP TABLE tmp_final_grouped AS", text)
+        self.assertIn("CREATE TEMP TABLE tmp_final_totals AS", text)
+        self.assertIn('cur.execute("ANALYZE tmp_weighted_candidates")', text)
+        self.assertIn('cur.execute("ANALYZE tmp_final_grouped")', text)
+        self.assertIn("FROM tmp_final_grouped AS g\n                JOIN tmp_final_totals AS t", text)
+
     def test_verify_requires_exact_sum_one(self) -> None:
         text = WORKFLOWS.read_text(encoding="utf-8")
         self.assertIn("HAVING SUM(probability)::numeric(10,4) <> 1.0000", text)
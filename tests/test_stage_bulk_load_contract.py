@@ -0,0 +1,70 @@
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKFLOWS = ROOT / "pipeline" / "src" / "pipeline" / "build" / "workflows.py"
+
+
+class StageBulkLoadContractTests(unittest.TestCase):
+    def test_onspd_stage_is_set_based_sql(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        start = text.index("def _populate_stage_onspd(")
+        end = text.index("\ndef ", start + 1)
+        body = text[start:end]
+        self.assertIn("FROM raw.onspd_row AS r", body)
+        self.assertIn("INSERT INTO stage.onspd_postcode (", body)
+        self.assertNotIn("_iter_validated_raw_rows", body)
+
+    def test_stage_batch_sizes_are_env_tunable(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn('_env_positive_int("PIPELINE_RAW_FETCH_BATCH_SIZE", 50000)', text)
+        self.assertIn('_env_positive_int("PIPELINE_STAGE_INSERT_BATCH_SIZE", 10000)', text)
+        self.assertIn('_env_positive_int("PIPELINE_NARROW_STAGE_INSERT_BATCH_SIZE", 50000)', text)
+        self.assertIn('batch_size = _stage_insert_batch_size("stage.ppd_parsed_address")', text)
+
+    def test_keyed_stage_batches_collapse_duplicate_keys(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn("payload[usrn] = (", text)
+        self.assertIn("road_payload[feature_id] = (", text)
+        self.assertIn("payload[segment_id] = (", text)
+        self.assertIn("payload[row_hash] = (", text)
+        self.assertIn("rows = list(payload.values()) if isinstance(payload, dict) else payload", text)
+
+    def test_keyed_stage_counts_report_accepted_source_rows(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        for name in (
+            "_populate_stage_usrn",
+            "_populate_stage_open_roads",
+            "_populate_stage_osni",
+            "_populate_stage_dfi",
+            "_populate_stage_ppd",
+        ):
+            start = text.index(f"def {name}(")
+            end = text.index("\ndef ", start + 1)
+            body = text[start:end]
+            self.assertIn("        inserted += 1\n", body)
+            self.assertNotIn("inserted += _copy_stage_batch(", body)
+        self.assertIn("            road_inserted += 1\n", text)
+        self.assertIn("postcode_inserted += 1\n", text)
+        self.assertNotIn("postcode_inserted += _copy_stage_batch(", text)
+
+    def test_keyed_stage_batches_load_via_copy_and_single_merge(self) -> None:
+        text = WORKFLOWS.read_text(encoding="utf-8")
+        self.assertIn('COPY {} ({}) FROM STDIN', text)
+        self.assertIn('INSERT INTO {} ({}) SELECT {} FROM {} {}', text)
+        for target in (
+            "STAGE_USRN_COPY",
+            "STAGE_OPEN_NAMES_POSTCODE_COPY",
+            "STAGE_OPEN_ROADS_COPY",
+            "STAGE_OSNI_COPY",
+            "STAGE_DFI_COPY",
+            "STAGE_PPD_COPY",
+        ):
+            self.assertIn(f"{target} = StageCopyTarget(", text)
+            self.assertIn(f"_copy_stage_batch(conn, {target},", text)
+        self.assertIn("postcode_payload[source_row_num] = (", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
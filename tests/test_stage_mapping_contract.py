@@ -52,12 +52,16 @@ class StageMappingContractTests(unittest.TestCase):
 
     def test_stage_extractors_use_mapped_field_lookup(self) -> None:
         text = WORKFLOWS.read_text(encoding="utf-8")
-        self.assertIn('name_raw = _field_value(row, field_map, "street_name")', text)
-        self.assertIn('postcode_raw = _field_value(row, field_map, "postcode")', text)
-        self.assertIn('toid_raw = _field_value(row, field_map, "toid")', text)
-        self.assertIn('usrn_raw = _field_value(row, field_map, "usrn")', text)
-        self.assertIn('street_type_raw = _field_value(row, field_map, "street_type")', text)
-        self.assertIn('street_status_raw = _field_value(row, field_map, "street_status")', text)
+        self.assertIn('postcode_raw = field_value(row, "postcode")', text)
+        self.assertIn('toid_raw = field_value(row, "toid")', text)
+        self.assertIn(
+            'field_value = _field_resolver(field_map, ("usrn", "street_name", "street_type", "street_status"))',
+            text,
+        )
+        self.assertIn('name_raw = field_value(row, "street_name")', text)
+        self.assertIn('usrn_raw = field_value(row, "usrn")', text)
+        self.assertIn('street_type_raw = field_value(row, "street_type")', text)
+        self.assertIn('street_status_raw = field_value(row, "street_status")', text)
 
     def test_required_field_validation_is_not_limited_to_first_raw_row(self) -> None:
         text = WORKFLOWS.read_text(encoding="utf-8")